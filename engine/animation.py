@@ -1,43 +1,115 @@
-from dataclasses import dataclass
+import numpy as np
+from dataclasses import dataclass, field
 from typing import Callable
 
 def linear(t): return t
 def ease_in_quad(t): return t * t
 def ease_out_quad(t): return t * (2 - t)
-def ease_in_out_quad(t): return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
-def bounce_out(t):
+def ease_out_cubic(t): t -= 1.0; return t * t * t + 1.0
+def _ease_in_out_quad(t): return 2 * t * t if t < 0.5 else -1 + (4 - 2 * t) * t
+def _bounce_out(t):
     n1, d1 = 7.5625, 2.75
     if t < 1 / d1: return n1 * t * t
     elif t < 2 / d1: t -= 1.5 / d1; return n1 * t * t + 0.75
     elif t < 2.5 / d1: t -= 2.25 / d1; return n1 * t * t + 0.9375
     t -= 2.625 / d1; return n1 * t * t + 0.984375
 
+# Branchy curves are sampled once into tables and linearly interpolated at runtime
+_LUT_N = 1024
+_EASE_IN_OUT_LUT = np.array([_ease_in_out_quad(i / (_LUT_N - 1)) for i in range(_LUT_N)], dtype=np.float32)
+_BOUNCE_LUT = np.array([_bounce_out(i / (_LUT_N - 1)) for i in range(_LUT_N)], dtype=np.float32)
+_EASE_IN_OUT_L, _BOUNCE_L = _EASE_IN_OUT_LUT.tolist(), _BOUNCE_LUT.tolist()
+
+def _sample(lut, t):
+    i = min(max(t, 0.0), 1.0) * (_LUT_N - 1); i0 = min(int(i), _LUT_N - 2); f = i - i0
+    return lut[i0] * (1 - f) + lut[i0 + 1] * f
+def ease_in_out_quad(t): return _sample(_EASE_IN_OUT_L, t)
+def bounce_out(t): return _sample(_BOUNCE_L, t)
+
+# Array versions of the built-in curves, indexed by curve id; custom curves get id -1
+_LUT_X = np.linspace(0.0, 1.0, _LUT_N)
+_CURVE_IDS = {linear: 0, ease_in_quad: 1, ease_out_quad: 2, ease_in_out_quad: 3, bounce_out: 4, ease_out_cubic: 5}
+_CURVES_VEC = (lambda t: t, lambda t: t * t, lambda t: t * (2 - t), lambda t: np.interp(t, _LUT_X, _EASE_IN_OUT_LUT), lambda t: np.interp(t, _LUT_X, _BOUNCE_LUT), lambda t: (t - 1) ** 3 + 1)
+
 class AnimationCurve:
     LINEAR, EASE_IN, EASE_OUT, EASE_IN_OUT, BOUNCE = linear, ease_in_quad, ease_out_quad, ease_in_out_quad, bounce_out
+    EASE_OUT_CUBIC = ease_out_cubic
 
-@dataclass
+@dataclass(slots=True)
 class Tween:
     name: str; start_val: float; end_val: float; duration: float; elapsed: float = 0.0
-    curve: Callable = linear; on_complete: Callable = None
+    curve: Callable = linear; on_complete: Callable = None; curve_id: int = field(init=False, default=-1)
+    def __post_init__(self): self.curve_id = _CURVE_IDS.get(self.curve, -1)
     @property
     def value(self):
         if self.duration == 0: return self.end_val
-        return self.start_val + (self.end_val - self.start_val) * self.curve(min(1.0, max(0.0, self.elapsed / self.duration)))
+        t = min(1.0, max(0.0, self.elapsed / self.duration)); cid = self.curve_id
+        # Built-in curves are inlined; only custom curves pay for the indirect call
+        if cid == 0: v = t
+        elif cid == 1: v = t * t
+        elif cid == 2: v = t * (2 - t)
+        elif cid == 3: v = _sample(_EASE_IN_OUT_L, t)
+        elif cid == 4: v = _sample(_BOUNCE_L, t)
+        elif cid == 5: t -= 1.0; v = t * t * t + 1.0
+        else: v = self.curve(t)
+        return self.start_val + (self.end_val - self.start_val) * v
     @property
     def is_finished(self): return self.elapsed >= self.duration
 
 class Animator:
-    def __init__(self): self.tweens = []
+    def __init__(self):
+        self.tweens = []; self._index = {}
+        # SoA mirror of self.tweens so update() advances and evaluates every tween in one pass
+        self._elapsed, self._dur, self._s, self._e = np.empty(0), np.empty(0), np.empty(0), np.empty(0)
+        self._cid = np.empty(0, dtype=np.int8)
+        self.values = np.empty(0)
     def to(self, name, start, end, duration, curve=linear, on_complete=None):
-        t = Tween(name, start, end, duration, 0.0, curve, on_complete); self.tweens.append(t); return t
+        t = Tween(name, start, end, duration, 0.0, curve, on_complete)
+        i = self._index.get(name)
+        if i is None:
+            # New name: grow every array by one slot
+            i = self._index[name] = len(self.tweens); self.tweens.append(t)
+            self._elapsed, self._dur = np.append(self._elapsed, 0.0), np.append(self._dur, 0.0)
+            self._s, self._e = np.append(self._s, 0.0), np.append(self._e, 0.0)
+            self._cid, self.values = np.append(self._cid, np.int8(0)), np.append(self.values, 0.0)
+        else: self.tweens[i] = t
+        self._elapsed[i], self._dur[i], self._s[i], self._e[i] = 0.0, duration, start, end
+        self._cid[i], self.values[i] = t.curve_id, t.value
+        return t
+    def get_tween(self, name):
+        i = self._index.get(name)
+        return None if i is None else self.tweens[i]
+    def _swap_remove(self, i):
+        last = len(self.tweens) - 1
+        if i != last:
+            tw = self.tweens[i] = self.tweens[last]; self._index[tw.name] = i
+            for a in (self._elapsed, self._dur, self._s, self._e, self._cid, self.values): a[i] = a[last]
+        self.tweens.pop()
+        self._elapsed, self._dur, self._s, self._e = self._elapsed[:last], self._dur[:last], self._s[:last], self._e[:last]
+        self._cid, self.values = self._cid[:last], self.values[:last]
     def update(self, dt):
-        for t in self.tweens[:]:
-            t.elapsed += dt
-            if t.is_finished:
-                if t.on_complete: t.on_complete()
-                self.tweens.remove(t)
-    def remove_tween(self, name): self.tweens = [t for t in self.tweens if t.name != name]
-
-@dataclass
+        if not self.tweens: return
+        self._elapsed += dt
+        t = np.clip(np.divide(self._elapsed, self._dur, out=np.ones_like(self._elapsed), where=self._dur > 0), 0.0, 1.0)
+        out = np.empty_like(t)
+        for k, fn in enumerate(_CURVES_VEC):
+            sel = self._cid == k
+            if sel.any(): out[sel] = fn(t[sel])
+        for i in np.flatnonzero(self._cid < 0).tolist(): out[i] = self.tweens[i].curve(float(t[i]))
+        self.values = self._s + (self._e - self._s) * out
+        for tw, e in zip(self.tweens, self._elapsed.tolist()): tw.elapsed = e
+        done = np.flatnonzero(self._elapsed >= self._dur).tolist()
+        if not done: return
+        # Drop finished tweens before running callbacks so on_complete can safely add or remove tweens;
+        # going from the back keeps swap-remove from moving a finished tween into an earlier slot
+        finished = [self.tweens[i] for i in done]
+        for i in reversed(done): del self._index[self.tweens[i].name]; self._swap_remove(i)
+        for tw in finished:
+            if tw.on_complete: tw.on_complete()
+    def remove_tween(self, name):
+        i = self._index.pop(name, None)
+        if i is not None: self._swap_remove(i)
+
+@dataclass(slots=True)
 class SpriteAnimation:
     name: str; frames: list[int]; frame_duration: float = 0.1; loop: bool = True
\ No newline at end of file
@@ -1,12 +1,19 @@
+import os
 import skia
-from engine.file import FileManager, SpriteSheet
+from functools import lru_cache
+from engine.file import FileManager, SpriteSheet, resource_path
 from engine.sound import SoundManager
 
+@lru_cache(maxsize=256)
+def _get_font_cached(name, size):
+    tf = skia.Typeface.MakeFromName(name, skia.FontStyle.Normal()) or skia.Typeface.MakeDefault()
+    return skia.Font(tf, size)
+
 class AssetManager:
     _instance = None
     def __init__(self):
         self.files = FileManager.get(); self.audio = SoundManager.get()
-        self.images, self.spritesheets, self.fonts = {}, {}, {}
+        self.images, self.spritesheets = {}, {}
 
     @classmethod
     def get(cls):
@@ -14,14 +21,15 @@ class AssetManager:
         return cls._instance
 
     def load_image(self, path, key=None):
-        key = key or path
+        # Key on the resolved file so "./a.png" and "a.png" share one decode
+        key = key or os.path.realpath(resource_path(path))
         if key in self.images: return self.images[key]
         img = self.files.load_image(path)
         if img: self.images[key] = img
         return img
 
     def load_spritesheet(self, path, frame_w, frame_h, offset=0, key=None):
-        key = key or path
+        key = key or os.path.realpath(resource_path(path))
         if key in self.spritesheets: return self.spritesheets[key]
         sheet = self.files.load_spritesheet(path, frame_w, frame_h, offset)
         if sheet: self.spritesheets[key] = sheet
@@ -30,9 +38,4 @@ class AssetManager:
     def load_sound(self, path, key=None): self.audio.load(path, key)
     def play_sound(self, key, volume=1.0): self.audio.play(key, volume)
 
-    def get_font(self, name, size):
-        k = f"{name}_{size}"
-        if k in self.fonts: return self.fonts[k]
-        tf = skia.Typeface.MakeFromName(name, skia.FontStyle.Normal()) or skia.Typeface.MakeDefault()
-        font = skia.Font(tf, size); self.fonts[k] = font
-        return font
\ No newline at end of file
+    def get_font(self, name, size): return _get_font_cached(name, size)
\ No newline at end of file
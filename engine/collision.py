@@ -1,73 +1,81 @@
 import math
+import numpy as np
 from dataclasses import dataclass
 from typing import Optional, Tuple
 from engine.physics import RigidBody, Vec2
+from engine.collision_kernels import HAS_NUMBA, _cc, _cr, _resolve_all, _rr
 
-@dataclass
+@dataclass(slots=True)
 class CollisionInfo:
     hit: bool = False
     normal: Vec2 | None = None
     depth: float = 0.0
     point: Vec2 | None = None
 
+# Shared miss result; callers only read .hit on a miss, so it is never mutated.
+# Hits are deliberately not pooled: CollisionWorld resolves on raw floats and never builds one, so a hit
+# object only reaches outside callers, who may keep it; recycling it would silently rewrite their result.
+_NO_HIT = CollisionInfo(hit=False)
+
 def circle_vs_circle(pos_a, radius_a, pos_b, radius_b):
-    diff = pos_b - pos_a
-    dist = diff.length()
-    min_dist = radius_a + radius_b
-    if dist >= min_dist or dist == 0: return CollisionInfo(hit=False)
-    normal = diff.normalized()
-    return CollisionInfo(hit=True, normal=normal, depth=min_dist - dist, point=pos_a + normal * radius_a)
+    hit, nx, ny, depth, px, py = _cc(pos_a.x, pos_a.y, radius_a, pos_b.x, pos_b.y, radius_b)
+    if not hit: return _NO_HIT
+    return CollisionInfo(hit=True, normal=Vec2(nx, ny), depth=depth, point=Vec2(px, py))
 
 def circle_vs_rect(circle_pos, radius, rect_x, rect_y, rect_w, rect_h):
-    closest_x = max(rect_x, min(circle_pos.x, rect_x + rect_w))
-    closest_y = max(rect_y, min(circle_pos.y, rect_y + rect_h))
-    closest = Vec2(closest_x, closest_y)
-    diff = circle_pos - closest
-    dist = diff.length()
-    if dist >= radius: return CollisionInfo(hit=False)
-    if dist == 0:
-        dl, dr = circle_pos.x - rect_x, (rect_x + rect_w) - circle_pos.x
-        dt, db = circle_pos.y - rect_y, (rect_y + rect_h) - circle_pos.y
-        min_p = min(dl, dr, dt, db)
-        if min_p == dl: normal = Vec2(-1, 0)
-        elif min_p == dr: normal = Vec2(1, 0)
-        elif min_p == dt: normal = Vec2(0, -1)
-        else: normal = Vec2(0, 1)
-        return CollisionInfo(hit=True, normal=normal, depth=radius + min_p, point=closest)
-    return CollisionInfo(hit=True, normal=diff.normalized(), depth=radius - dist, point=closest)
+    hit, nx, ny, depth, px, py = _cr(circle_pos.x, circle_pos.y, radius, rect_x, rect_y, rect_w, rect_h)
+    if not hit: return _NO_HIT
+    return CollisionInfo(hit=True, normal=Vec2(nx, ny), depth=depth, point=Vec2(px, py))
 
 def rect_vs_rect(ax, ay, aw, ah, bx, by, bw, bh):
-    overlap_x = min(ax + aw, bx + bw) - max(ax, bx)
-    overlap_y = min(ay + ah, by + bh) - max(ay, by)
-    if overlap_x <= 0 or overlap_y <= 0: return CollisionInfo(hit=False)
-    if overlap_x < overlap_y: return CollisionInfo(hit=True, normal=Vec2(1 if ax < bx else -1, 0), depth=overlap_x)
-    return CollisionInfo(hit=True, normal=Vec2(0, 1 if ay < by else -1), depth=overlap_y)
+    hit, nx, ny, depth, _, _ = _rr(ax, ay, aw, ah, bx, by, bw, bh)
+    if not hit: return _NO_HIT
+    return CollisionInfo(hit=True, normal=Vec2(nx, ny), depth=depth)
+
+def pack_static_rects(rects):
+    # Lists are expected to be homogeneous: either all Rect-like objects or all (x, y, w, h) tuples
+    if isinstance(rects, np.ndarray): return rects
+    if rects and hasattr(rects[0], "x"): rects = [(r.x, r.y, r.w, r.h) for r in rects]
+    return np.array(rects, dtype=np.float64).reshape(-1, 4)
 
 def resolve_rect_vs_static(body, width, height, static_rects, padding=4.0, epsilon=0.01):
     grounded, hit_ceiling = False, False
     pad_x, pad_y = min(padding, width * 0.4), min(padding, height * 0.4)
-    for r in static_rects:
-        rx, ry, rw, rh = (r.x, r.y, r.w, r.h) if hasattr(r, "x") else r
-        px, py = body.position.x - width / 2, body.position.y - height / 2
-        if px + pad_x < rx + rw and px + width - pad_x > rx:
-            if py < ry + rh and py + height > ry:
-                if (py + height) - ry < (ry + rh) - py:
-                    body.position.y = ry - height / 2 - epsilon
-                    if body.velocity.y > 0: body.velocity.y = 0; grounded = True
-                else:
-                    body.position.y = ry + rh + height / 2 + epsilon
-                    if body.velocity.y < 0: body.velocity.y = 0; hit_ceiling = True
-    for r in static_rects:
-        rx, ry, rw, rh = (r.x, r.y, r.w, r.h) if hasattr(r, "x") else r
-        px, py = body.position.x - width / 2, body.position.y - height / 2
-        if py + pad_y < ry + rh and py + height - pad_y > ry:
-            if px < rx + rw and px + width > rx:
-                if (px + width) - rx < (rx + rw) - px:
-                    body.position.x = rx - width / 2 - epsilon
-                    if body.velocity.x > 0: body.velocity.x = 0
-                else:
-                    body.position.x = rx + rw + width / 2 + epsilon
-                    if body.velocity.x < 0: body.velocity.x = 0
+    arr = pack_static_rects(static_rects)
+    xs, ys, ws, hs = arr[:, 0], arr[:, 1], arr[:, 2], arr[:, 3]
+    # Pass 1 only moves y, so the x-overlap filter is done for all rects up front. Each step resolves the
+    # minimum-penetration rect; the loop only repeats if the push left the body inside another one
+    half_w, half_h = width / 2, height / 2
+    px, py = body.position.x - half_w, body.position.y - half_h
+    cand = arr[(px + pad_x < xs + ws) & (px + width - pad_x > xs)]
+    for _ in range(len(cand)):
+        top, bottom = (py + height) - cand[:, 1], (cand[:, 1] + cand[:, 3]) - py
+        pen = np.where((top > 0) & (bottom > 0), np.minimum(top, bottom), np.inf)
+        k = int(np.argmin(pen))
+        if pen[k] == np.inf: break
+        ry, rh = float(cand[k, 1]), float(cand[k, 3])
+        if top[k] < bottom[k]:
+            body.position.y = ry - half_h - epsilon
+            if body.velocity.y > 0: body.velocity.y = 0; grounded = True
+        else:
+            body.position.y = ry + rh + half_h + epsilon
+            if body.velocity.y < 0: body.velocity.y = 0; hit_ceiling = True
+        py = body.position.y - half_h
+    # Pass 2 only moves x, same scheme on the other axis
+    cand = arr[(py + pad_y < ys + hs) & (py + height - pad_y > ys)]
+    for _ in range(len(cand)):
+        left, right = (px + width) - cand[:, 0], (cand[:, 0] + cand[:, 2]) - px
+        pen = np.where((left > 0) & (right > 0), np.minimum(left, right), np.inf)
+        k = int(np.argmin(pen))
+        if pen[k] == np.inf: break
+        rx, rw = float(cand[k, 0]), float(cand[k, 2])
+        if left[k] < right[k]:
+            body.position.x = rx - half_w - epsilon
+            if body.velocity.x > 0: body.velocity.x = 0
+        else:
+            body.position.x = rx + rw + half_w + epsilon
+            if body.velocity.x < 0: body.velocity.x = 0
+        px = body.position.x - half_w
     return grounded, hit_ceiling
 
 def resolve_collision(body_a, body_b, info):
@@ -81,24 +89,104 @@ def resolve_collision(body_a, body_b, info):
     vel_along_normal = rel_vel.dot(info.normal)
     if vel_along_normal > 0: return
     e = min(body_a.restitution, body_b.restitution)
-    inv_mass_a = 0 if body_a.is_static else 1.0 / body_a.mass
-    inv_mass_b = 0 if body_b.is_static else 1.0 / body_b.mass
+    inv_mass_a, inv_mass_b = body_a.inv_mass, body_b.inv_mass
     j = -(1 + e) * vel_along_normal / (inv_mass_a + inv_mass_b)
     impulse = info.normal * j
     if not body_a.is_static: body_a.velocity = body_a.velocity - impulse * inv_mass_a
     if not body_b.is_static: body_b.velocity = body_b.velocity + impulse * inv_mass_b
 
+def _resolve_floats(ax, ay, bx, by, avx, avy, bvx, bvy, inv_ma, inv_mb, e, nx, ny, depth):
+    # Float-only resolve_collision; a zero inverse mass marks a static body
+    if inv_ma == 0: bx += nx * depth; by += ny * depth
+    elif inv_mb == 0: ax -= nx * depth; ay -= ny * depth
+    else: h = depth / 2; ax -= nx * h; ay -= ny * h; bx += nx * h; by += ny * h
+    vel_along_normal = (bvx - avx) * nx + (bvy - avy) * ny
+    inv_sum = inv_ma + inv_mb
+    if vel_along_normal > 0 or inv_sum == 0: return ax, ay, bx, by, avx, avy, bvx, bvy
+    j = -(1 + e) * vel_along_normal / inv_sum
+    return ax, ay, bx, by, avx - nx * j * inv_ma, avy - ny * j * inv_ma, bvx + nx * j * inv_mb, bvy + ny * j * inv_mb
+
+def _resolve_contact(ba, bb, nx, ny, depth):
+    pa, pb, va, vb = ba.position, bb.position, ba.velocity, bb.velocity
+    pa.x, pa.y, pb.x, pb.y, va.x, va.y, vb.x, vb.y = _resolve_floats(
+        pa.x, pa.y, pb.x, pb.y, va.x, va.y, vb.x, vb.y, ba.inv_mass, bb.inv_mass,
+        min(ba.restitution, bb.restitution), nx, ny, depth)
+
 class CollisionWorld:
     def __init__(self):
         self.circles = []; self.rects = []
-    def add_circle(self, b, r): self.circles.append((b, r))
-    def add_rect(self, b, w, h): self.rects.append((b, w, h))
+        # Shape SoA for the fused kernel, and the broad-phase grid of cell -> body indices
+        self._radius, self._rw, self._rh = np.empty(0), np.empty(0), np.empty(0)
+        self._grid: dict[tuple[int, int], list[int]] = {}
+    def add_circle(self, b, r): self.circles.append((b, r)); self._radius = np.append(self._radius, float(r))
+    def add_rect(self, b, w, h): self.rects.append((b, w, h)); self._rw = np.append(self._rw, float(w)); self._rh = np.append(self._rh, float(h))
+    def _bodies(self): return [b for b, _ in self.circles] + [b for b, _, _ in self.rects]
+    def _grid_pairs(self, bodies):
+        # Circles come first, then rects; pairs are ordered circle-circle, circle-rect, rect-rect like the dense loops were.
+        # Cells are widened by a margin of max extent, so the pairs stay a superset of what the sequential pass can
+        # bring into contact as long as no body is pushed further than that margin (checked after the pass)
+        nc = len(self.circles)
+        ext = [r for _, r in self.circles] + [max(w, h) / 2 for _, w, h in self.rects]
+        if len(bodies) < 2: return [], 0.0
+        margin = max(max(ext), 1e-6); cs = 4 * margin
+        self._grid = {}
+        for k, b in enumerate(bodies): self._grid.setdefault((int(b.position.x // cs), int(b.position.y // cs)), []).append(k)
+        pairs = set()
+        for (gx, gy), cell in self._grid.items():
+            for ox in (-1, 0, 1):
+                for oy in (-1, 0, 1):
+                    for j in self._grid.get((gx + ox, gy + oy), ()):
+                        for i in cell:
+                            if i < j: pairs.add((i, j))
+        return sorted(pairs, key=lambda p: (0 if p[1] < nc else 1 if p[0] < nc else 2, p)), margin
+    def _dense_pairs(self):
+        # Every pair in the order of the original nested loops; fallback when a push outran the grid margin
+        nc, n = len(self.circles), len(self.circles) + len(self.rects)
+        return [(i, j) for i in range(nc) for j in range(i + 1, nc)] + [(i, j) for i in range(nc) for j in range(nc, n)] + \
+               [(i, j) for i in range(nc, n) for j in range(i + 1, n)]
+    def _resolve_fused(self, bodies, pairs, margin):
+        n, nc = len(bodies), len(self.circles)
+        pos_x = np.fromiter((b.position.x for b in bodies), dtype=np.float64, count=n)
+        pos_y = np.fromiter((b.position.y for b in bodies), dtype=np.float64, count=n)
+        vel_x = np.fromiter((b.velocity.x for b in bodies), dtype=np.float64, count=n)
+        vel_y = np.fromiter((b.velocity.y for b in bodies), dtype=np.float64, count=n)
+        static = np.fromiter((b.is_static for b in bodies), dtype=np.bool_, count=n)
+        inv_mass = np.fromiter((b.inv_mass for b in bodies), dtype=np.float64, count=n)
+        rest = np.fromiter((b.restitution for b in bodies), dtype=np.float64, count=n)
+        pad = np.zeros(nc)
+        rad, w, h = np.concatenate((self._radius, np.zeros(n - nc))), np.concatenate((pad, self._rw)), np.concatenate((pad, self._rh))
+        start = (pos_x.copy(), pos_y.copy(), vel_x.copy(), vel_y.copy())
+        for attempt in (pairs, None):
+            if attempt is None:
+                for a, a0 in zip((pos_x, pos_y, vel_x, vel_y), start): a[:] = a0
+                attempt = self._dense_pairs()
+            touched = np.zeros(n, dtype=np.bool_)
+            pa, pb = np.array(attempt, dtype=np.int64).reshape(-1, 2).T
+            _resolve_all(np.ascontiguousarray(pa), np.ascontiguousarray(pb), pos_x, pos_y, vel_x, vel_y, inv_mass, rest, static, rad, w, h, nc, touched)
+            if max(np.abs(pos_x - start[0]).max(), np.abs(pos_y - start[1]).max()) <= margin: break
+        for k in np.flatnonzero(touched).tolist():
+            p, v = bodies[k].position, bodies[k].velocity
+            p.x, p.y, v.x, v.y = float(pos_x[k]), float(pos_y[k]), float(vel_x[k]), float(vel_y[k])
+    def _resolve_pairs(self, pairs):
+        nc = len(self.circles)
+        for i, j in pairs:
+            if j < nc:
+                (ba, ra), (bb, rb) = self.circles[i], self.circles[j]; pa, pb = ba.position, bb.position
+                hit, nx, ny, depth, _, _ = _cc(pa.x, pa.y, ra, pb.x, pb.y, rb)
+            elif i < nc:
+                (ba, rc), (bb, w, h) = self.circles[i], self.rects[j - nc]; pa, pb = ba.position, bb.position
+                hit, nx, ny, depth, _, _ = _cr(pa.x, pa.y, rc, pb.x - w/2, pb.y - h/2, w, h)
+            else:
+                (ba, wa, ha), (bb, wb, hb) = self.rects[i - nc], self.rects[j - nc]; pa, pb = ba.position, bb.position
+                hit, nx, ny, depth, _, _ = _rr(pa.x - wa/2, pa.y - ha/2, wa, ha, pb.x - wb/2, pb.y - hb/2, wb, hb)
+            if hit: _resolve_contact(ba, bb, nx, ny, depth)
     def check_and_resolve(self):
-        for i, (ba, ra) in enumerate(self.circles):
-            for j, (bb, rb) in enumerate(self.circles):
-                if i < j: resolve_collision(ba, bb, circle_vs_circle(ba.position, ra, bb.position, rb))
-        for bc, rc in self.circles:
-            for br, w, h in self.rects: resolve_collision(bc, br, circle_vs_rect(bc.position, rc, br.position.x-w/2, br.position.y-h/2, w, h))
-        for i, (ba, wa, ha) in enumerate(self.rects):
-            for j, (bb, wb, hb) in enumerate(self.rects):
-                if i < j: resolve_collision(ba, bb, rect_vs_rect(ba.position.x-wa/2, ba.position.y-ha/2, wa, ha, bb.position.x-wb/2, bb.position.y-hb/2, wb, hb))
\ No newline at end of file
+        bodies = self._bodies(); pairs, margin = self._grid_pairs(bodies)
+        if not pairs: return
+        if HAS_NUMBA: return self._resolve_fused(bodies, pairs, margin)
+        start = [(b.position.x, b.position.y, b.velocity.x, b.velocity.y) for b in bodies]
+        self._resolve_pairs(pairs)
+        if all(abs(b.position.x - x) <= margin and abs(b.position.y - y) <= margin for b, (x, y, _, _) in zip(bodies, start)): return
+        # A chain of pushes moved a body past the margin; replay the pass over every pair from the start state
+        for b, (x, y, vx, vy) in zip(bodies, start): b.position.x, b.position.y, b.velocity.x, b.velocity.y = x, y, vx, vy
+        self._resolve_pairs(self._dense_pairs())
@@ -0,0 +1,74 @@
+import math
+
+try: from numba import njit; HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+    # numba is optional; without it the kernels run as plain Python on floats
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]): return args[0]
+        return lambda f: f
+
+@njit(cache=True, fastmath=True)
+def _cc(ax, ay, ra, bx, by, rb):
+    dx, dy = bx - ax, by - ay
+    min_dist = ra + rb
+    # Box reject first so most misses never reach the sqrt
+    if abs(dx) >= min_dist or abs(dy) >= min_dist: return False, 0.0, 0.0, 0.0, 0.0, 0.0
+    d2 = dx * dx + dy * dy
+    if d2 >= min_dist * min_dist or d2 == 0: return False, 0.0, 0.0, 0.0, 0.0, 0.0
+    dist = math.sqrt(d2); inv = 1.0 / dist
+    nx, ny = dx * inv, dy * inv
+    return True, nx, ny, min_dist - dist, ax + nx * ra, ay + ny * ra
+
+@njit(cache=True, fastmath=True)
+def _cr(cx, cy, r, rx, ry, rw, rh):
+    qx, qy = max(rx, min(cx, rx + rw)), max(ry, min(cy, ry + rh))
+    dx, dy = cx - qx, cy - qy
+    d2 = dx * dx + dy * dy
+    if d2 >= r * r: return False, 0.0, 0.0, 0.0, 0.0, 0.0
+    if d2 == 0:
+        dl, dr = cx - rx, (rx + rw) - cx
+        dt, db = cy - ry, (ry + rh) - cy
+        min_p = min(dl, dr, dt, db)
+        if min_p == dl: nx, ny = -1.0, 0.0
+        elif min_p == dr: nx, ny = 1.0, 0.0
+        elif min_p == dt: nx, ny = 0.0, -1.0
+        else: nx, ny = 0.0, 1.0
+        return True, nx, ny, r + min_p, qx, qy
+    dist = math.sqrt(d2); inv = 1.0 / dist
+    return True, dx * inv, dy * inv, r - dist, qx, qy
+
+@njit(cache=True, fastmath=True)
+def _rr(ax, ay, aw, ah, bx, by, bw, bh):
+    overlap_x = min(ax + aw, bx + bw) - max(ax, bx)
+    overlap_y = min(ay + ah, by + bh) - max(ay, by)
+    if overlap_x <= 0 or overlap_y <= 0: return False, 0.0, 0.0, 0.0, 0.0, 0.0
+    # Both candidate normals are computed and one is picked with selects, which LLVM lowers to blends
+    use_x = overlap_x < overlap_y
+    sx, sy = 1.0 if ax < bx else -1.0, 1.0 if ay < by else -1.0
+    return True, sx if use_x else 0.0, 0.0 if use_x else sy, overlap_x if use_x else overlap_y, 0.0, 0.0
+
+@njit(cache=True, fastmath=True)
+def _apply_contact(a, b, nx, ny, depth, pos_x, pos_y, vel_x, vel_y, inv_mass, rest, static, touched):
+    if static[a]: pos_x[b] += nx * depth; pos_y[b] += ny * depth
+    elif static[b]: pos_x[a] -= nx * depth; pos_y[a] -= ny * depth
+    else:
+        pos_x[a] -= nx * depth / 2; pos_y[a] -= ny * depth / 2
+        pos_x[b] += nx * depth / 2; pos_y[b] += ny * depth / 2
+    touched[a] = True; touched[b] = True
+    vel_along_normal = (vel_x[b] - vel_x[a]) * nx + (vel_y[b] - vel_y[a]) * ny
+    inv_sum = inv_mass[a] + inv_mass[b]
+    if vel_along_normal > 0 or inv_sum == 0: return
+    j = -(1 + min(rest[a], rest[b])) * vel_along_normal / inv_sum
+    vel_x[a] -= nx * j * inv_mass[a]; vel_y[a] -= ny * j * inv_mass[a]
+    vel_x[b] += nx * j * inv_mass[b]; vel_y[b] += ny * j * inv_mass[b]
+
+@njit(cache=True, fastmath=True)
+def _resolve_all(pairs_a, pairs_b, pos_x, pos_y, vel_x, vel_y, inv_mass, rest, static, rad, w, h, n_circles, touched):
+    # Bodies [0, n_circles) are circles, the rest are rects; pairs come from the broad phase in resolution order
+    for k in range(pairs_a.shape[0]):
+        i, j = pairs_a[k], pairs_b[k]
+        if j < n_circles: hit, nx, ny, depth, _, _ = _cc(pos_x[i], pos_y[i], rad[i], pos_x[j], pos_y[j], rad[j])
+        elif i < n_circles: hit, nx, ny, depth, _, _ = _cr(pos_x[i], pos_y[i], rad[i], pos_x[j] - w[j] / 2, pos_y[j] - h[j] / 2, w[j], h[j])
+        else: hit, nx, ny, depth, _, _ = _rr(pos_x[i] - w[i] / 2, pos_y[i] - h[i] / 2, w[i], h[i], pos_x[j] - w[j] / 2, pos_y[j] - h[j] / 2, w[j], h[j])
+        if hit: _apply_contact(i, j, nx, ny, depth, pos_x, pos_y, vel_x, vel_y, inv_mass, rest, static, touched)
@@ -4,7 +4,7 @@ from enum import Enum, auto
 class EventType(Enum):
     KEY_PRESS = auto(); KEY_RELEASE = auto(); MOUSE_PRESS = auto(); MOUSE_RELEASE = auto(); MOUSE_MOVE = auto(); SCROLL = auto(); RESIZE = auto()
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     type: EventType; key: int = 0; button: int = 0; x: float = 0.0; y: float = 0.0; dx: float = 0.0; dy: float = 0.0; width: int = 0; height: int = 0; mods: int = 0
 
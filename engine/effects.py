@@ -12,9 +12,9 @@ class PostProcessSystem:
         self.shake = max(0.0, self.shake - dt * 10.0)
         self.glitch = max(0.0, self.glitch - dt * 2.0)
         
-        if hasattr(self.engine, 'post_process_uniforms'):
-            self.engine.post_process_uniforms['time'] = self.time
-            self.engine.post_process_uniforms['intensity'] = self.glitch
+        # post_process_uniforms is a fresh snapshot dict, so writing into it never reached the shaders
+        if hasattr(self.engine, 'set_post_process'):
+            self.engine.set_post_process(self.glitch)
         
         if hasattr(self.engine, 'canvas_offset'):
             if self.shake > 0:
@@ -1,11 +1,14 @@
+import math
 import os
+import queue
+import threading
 import time
 import glfw
 import moderngl
 import numpy as np
 import skia
 from engine.component import Component, Event, EventType
-from engine.shaders import CRT_FRAG, DEFAULT_FRAG, DEFAULT_VERT, GLITCH_FRAG, VHS_FRAG, MATRIX_FRAG
+from engine.shaders import DEFAULT_VERT, MATRIX_MIN_INTENSITY, SHADERS
 from lib import tlog
 
 class CoreEngine:
@@ -17,6 +20,9 @@ class CoreEngine:
         self.show_fps = True
         self.debug_mode = False
         self.components: list[Component] = []
+        self._dispatch_order: list[Component] = [] # components newest-first, rebuilt in add_component
+        self._pending_events: list[Event] = []
+        self._move_pool: list[Event] = []; self._move_used = 0 # MOUSE_MOVE events recycled every poll
         self.last_heartbeat = time.perf_counter()
         self.frame_count = 0
         self.fps = 0.0
@@ -25,12 +31,17 @@ class CoreEngine:
         self.canvas_offset = (0.0, 0.0)
         self.post_process_time = 0.0
         self.post_process_intensity = 0.0
+        self.post_process_scale = 0.5
         self.active_shader = "default"
         self.active_shaders = ["vhs", "matrix", "crt"]
         self.shaders = {}
+        self.shader_uniforms = {}
         self.window = None
         self.ctx = None
         self.surface = None
+        self._recorder = skia.PictureRecorder()
+        self._raster_jobs, self._raster_done, self._raster_pending = queue.Queue(maxsize=1), threading.Event(), False
+        self._raster_thread, self._raster_error = None, None
 
         if not glfw.init(): raise RuntimeError("GLFW init failed")
 
@@ -49,10 +60,13 @@ class CoreEngine:
         self._init_skia_cpu(width, height)
         self._init_blit_pipeline()
         self._init_fonts()
+        self._raster_thread = threading.Thread(target=self._raster_loop, daemon=True); self._raster_thread.start()
 
     def _init_fonts(self):
         typeface = skia.Typeface.MakeFromName("Inter", skia.FontStyle.Normal())
         self.fps_font = skia.Font(typeface or skia.Typeface.MakeDefault(), 14)
+        self.fps_paint = skia.Paint(AntiAlias=True, Color=skia.ColorGREEN)
+        self._fps_shown, self._fps_blob = -1, None
 
     def _setup_callbacks(self):
         glfw.set_key_callback(self.window, self._on_key)
@@ -67,15 +81,67 @@ class CoreEngine:
         self._init_skia_cpu(width, height)
         self.ui_texture.release()
         self.ui_texture = self.ctx.texture((width, height), 4)
-        self.temp_texture.release()
-        self.temp_texture = self.ctx.texture((width, height), 4)
-        self.temp_texture2.release()
-        self.temp_texture2 = self.ctx.texture((width, height), 4)
+        for res in (self.fbo, self.fbo2, self.temp_texture, self.temp_texture2):
+            if res is not None: res.release()
+        self._init_post_targets(width, height)
+        for pbo in self.pbos: pbo.release()
+        self._init_pbos(width, height)
+
+    def _init_pbos(self, w, h):
+        # Two pixel-unpack buffers used alternately so the upload of one frame overlaps the next
+        self.pbos = [self.ctx.buffer(reserve=w * h * 4) for _ in range(2)]
+        self.pbo_index = 0
+
+    def _init_post_targets(self, w, h):
+        # Only the multi-pass chain (debug mode, or the fallback when the fused shader fails to compile) renders
+        # intermediates; normal play never does, so they are allocated on that chain's first use
+        self._post_size = (w, h)
+        self.temp_texture = self.temp_texture2 = self.fbo = self.fbo2 = None
+
+    def _ensure_post_targets(self):
+        if self.fbo is not None: return
+        # The noise-heavy VHS/Matrix intermediates run at reduced resolution; the CRT pass upsamples them with linear filtering
+        w, h = self._post_size
+        pw, ph = max(1, int(w * self.post_process_scale)), max(1, int(h * self.post_process_scale))
+        self.temp_texture = self.ctx.texture((pw, ph), 4)
+        self.temp_texture2 = self.ctx.texture((pw, ph), 4)
         self.fbo = self.ctx.framebuffer(color_attachments=[self.temp_texture])
         self.fbo2 = self.ctx.framebuffer(color_attachments=[self.temp_texture2])
 
     def _init_skia_cpu(self, w, h):
-        self.surface = skia.Surface.MakeRasterN32Premul(w, h)
+        self._raster_wait()
+        # Skia rasterizes straight into these arrays, so uploads read the surface's pixels with no readback copy.
+        # Two of them: the raster worker fills the back one while the front one is uploaded.
+        self._raster_bufs = [np.zeros((h, w, 4), dtype=np.uint8) for _ in range(2)]
+        self._raster_surfs = [skia.Surface(b, colorType=skia.ColorType.kN32_ColorType, alphaType=skia.AlphaType.kPremul_AlphaType) for b in self._raster_bufs]
+        self._raster_front = 0
+        self.pixel_buf, self.surface = self._raster_bufs[0], self._raster_surfs[0]
+
+    def _raster_loop(self):
+        while True:
+            pic, surf, clear = self._raster_jobs.get()
+            # A failed frame is handed back to the main thread; the event is always set so _raster_wait never hangs
+            try: canvas = surf.getCanvas(); canvas.clear(clear); canvas.drawPicture(pic)
+            except Exception as e: self._raster_error = e
+            finally: self._raster_done.set()
+
+    def _raster_wait(self):
+        # Block until the in-flight frame is rasterized, then make its buffer the front one
+        if not self._raster_pending: return
+        self._raster_done.wait(); self._raster_done.clear(); self._raster_pending = False
+        if (err := self._raster_error) is not None: self._raster_error = None; raise err
+        self._raster_front ^= 1
+        self.pixel_buf, self.surface = self._raster_bufs[self._raster_front], self._raster_surfs[self._raster_front]
+
+    def begin_ui_frame(self) -> skia.Canvas:
+        # UI is recorded on the main thread and played back by the raster worker
+        return self._recorder.beginRecording(skia.Rect.MakeWH(self.width, self.height))
+
+    def end_ui_frame(self, clear=skia.ColorTRANSPARENT):
+        # Hands this frame to the worker and makes the previous one current; the upload lags the update by one frame
+        pic = self._recorder.finishRecordingAsPicture()
+        self._raster_wait()
+        self._raster_jobs.put((pic, self._raster_surfs[self._raster_front ^ 1], clear)); self._raster_pending = True
 
     def _init_blit_pipeline(self):
         flip_verts = np.array([-1, -1, 0, 1, 1, -1, 1, 1, -1, 1, 0, 0, 1, 1, 1, 0], dtype="f4")
@@ -83,22 +149,33 @@ class CoreEngine:
         self.vbo = self.ctx.buffer(flip_verts)
         self.std_vbo = self.ctx.buffer(std_verts)
 
-        shader_configs = {"default": DEFAULT_FRAG, "glitch": GLITCH_FRAG, "crt": CRT_FRAG, "vhs": VHS_FRAG, "matrix": MATRIX_FRAG}
-        for name, frag in shader_configs.items():
-            try: self.shaders[name] = self.ctx.program(vertex_shader=DEFAULT_VERT, fragment_shader=frag)
-            except moderngl.Error as e: tlog.err(f"Shader '{name}' compilation failed: {e}")
-
         self.ui_texture = self.ctx.texture((self.width, self.height), 4)
-        self.temp_texture = self.ctx.texture((self.width, self.height), 4)
-        self.temp_texture2 = self.ctx.texture((self.width, self.height), 4)
-        self.fbo = self.ctx.framebuffer(color_attachments=[self.temp_texture])
-        self.fbo2 = self.ctx.framebuffer(color_attachments=[self.temp_texture2])
+        self._init_post_targets(self.width, self.height)
+        self._init_pbos(self.width, self.height)
+
+        self.noise_tex = self.ctx.texture((256, 256), 4, np.random.randint(0, 256, (256, 256, 4), dtype=np.uint8).tobytes())
+        self.noise_tex.repeat_x = self.noise_tex.repeat_y = True
+        self.noise_tex.filter = (moderngl.NEAREST, moderngl.NEAREST)
 
         self.blit_vaos = {}
         self.screen_vaos = {}
-        for name, prog in self.shaders.items():
-            self.blit_vaos[name] = self.ctx.vertex_array(prog, [(self.vbo, "2f 2f", "in_pos", "in_uv")])
-            self.screen_vaos[name] = self.ctx.vertex_array(prog, [(self.std_vbo, "2f 2f", "in_pos", "in_uv")])
+        # Only the default post-process chain is compiled before the first frame; run_heartbeat warms the rest,
+        # one per frame, so toggling an effect later never stalls on a compile
+        self._shader_srcs = dict(SHADERS)
+        for name in ("fused", "crt"): self._compile_shader(name)
+
+    def _compile_shader(self, name) -> bool:
+        frag = self._shader_srcs.pop(name, None)
+        if frag is None: return name in self.shaders
+        try: prog = self.ctx.program(vertex_shader=DEFAULT_VERT, fragment_shader=frag)
+        except moderngl.Error as e: tlog.err(f"Shader '{name}' compilation failed: {e}"); return False
+        self.shaders[name] = prog
+        if "noise_tex" in prog: prog["noise_tex"].value = 1
+        # Resolve the per-frame uniforms once instead of probing every program each frame
+        self.shader_uniforms[name] = {u: prog[u] for u in ("time", "time_block", "intensity", "resolution") if u in prog}
+        self.blit_vaos[name] = self.ctx.vertex_array(prog, [(self.vbo, "2f 2f", "in_pos", "in_uv")])
+        self.screen_vaos[name] = self.ctx.vertex_array(prog, [(self.std_vbo, "2f 2f", "in_pos", "in_uv")])
+        return True
 
     @property
     def active_shader_name(self) -> str: return self.active_shader
@@ -107,7 +184,7 @@ class CoreEngine:
     def post_process_uniforms(self) -> dict: return {"time": self.post_process_time, "intensity": self.post_process_intensity}
 
     def set_shader(self, name):
-        if name in self.shaders: self.active_shader = name
+        if self._compile_shader(name): self.active_shader = name
 
     def set_post_process(self, intensity: float):
         self.post_process_intensity = max(0.0, min(1.0, intensity))
@@ -123,45 +200,83 @@ class CoreEngine:
             elif k == glfw.KEY_F4: self.set_shader("crt")
             elif k == glfw.KEY_F5: self.set_shader("vhs")
             self.keys_pressed.add(k)
-            self._dispatch_event(Event(EventType.KEY_PRESS, key=k, mods=m))
+            self._pending_events.append(Event(EventType.KEY_PRESS, key=k, mods=m))
         elif a == glfw.RELEASE:
             self.keys_pressed.discard(k)
-            self._dispatch_event(Event(EventType.KEY_RELEASE, key=k, mods=m))
+            self._pending_events.append(Event(EventType.KEY_RELEASE, key=k, mods=m))
 
     def _on_mouse_button(self, w, b, a, m):
         etype = EventType.MOUSE_PRESS if a == glfw.PRESS else EventType.MOUSE_RELEASE
-        self._dispatch_event(Event(etype, button=b, x=self.mouse_x, y=self.mouse_y, mods=m))
+        self._pending_events.append(Event(etype, button=b, x=self.mouse_x, y=self.mouse_y, mods=m))
 
     def _on_mouse_move(self, w, x, y):
         self.mouse_x, self.mouse_y = x, y
-        self._dispatch_event(Event(EventType.MOUSE_MOVE, x=x, y=y))
+        pending = self._pending_events
+        # A run of moves only needs its last position, so update the queued move in place
+        if pending and pending[-1].type == EventType.MOUSE_MOVE: ev = pending[-1]
+        else:
+            if self._move_used == len(self._move_pool): self._move_pool.append(Event(EventType.MOUSE_MOVE))
+            ev = self._move_pool[self._move_used]; self._move_used += 1; pending.append(ev)
+        ev.x, ev.y = x, y
 
     def _dispatch_event(self, event):
-        for comp in reversed(self.components):
+        for comp in self._dispatch_order:
             if comp.enabled and comp.on_event(event): break
 
+    def poll_events(self):
+        # Callbacks only queue events (runs of mouse moves already collapsed); they are dispatched here in one batch
+        glfw.poll_events()
+        if not self._pending_events: return
+        events, self._pending_events, self._move_used = self._pending_events, [], 0
+        for ev in events: self._dispatch_event(ev)
+
     def _upload_skia_to_texture(self):
-        image = self.surface.makeImageSnapshot()
-        self.ui_texture.write(image.tobytes())
+        pbo = self.pbos[self.pbo_index]; self.pbo_index ^= 1
+        # Orphaning hands the driver fresh storage, so the write never waits on a pending upload from this PBO
+        pbo.orphan(); pbo.write(self.pixel_buf); self.ui_texture.write(pbo)
 
     def _render_fps(self, canvas: skia.Canvas):
         if not self.show_fps: return
-        canvas.drawString(f"FPS: {int(self.fps)}", 10, 20, self.fps_font, skia.Paint(AntiAlias=True, Color=skia.ColorGREEN))
+        fps = int(self.fps)
+        # Only re-shape the text when the displayed number changes
+        if fps != self._fps_shown: self._fps_shown, self._fps_blob = fps, skia.TextBlob.MakeFromString(f"FPS: {fps}", self.fps_font)
+        canvas.drawTextBlob(self._fps_blob, 10, 20, self.fps_paint)
 
     def _update_shader_uniforms(self, dt: float):
-        self.post_process_time += dt
-        for prog in self.shaders.values():
-            if "time" in prog: prog["time"].value = self.post_process_time
-            if "intensity" in prog: prog["intensity"].value = self.post_process_intensity
-            if "resolution" in prog: prog["resolution"].value = (self.width, self.height)
+        self.post_process_time += dt; t = self.post_process_time
+        time_block = (math.floor(t * 10.0), math.floor(t * 15.0), math.floor(t * 60.0))
+        for us in self.shader_uniforms.values():
+            if (u := us.get("time")) is not None: u.value = t
+            if (u := us.get("time_block")) is not None: u.value = time_block
+            if (u := us.get("intensity")) is not None: u.value = self.post_process_intensity
+            if (u := us.get("resolution")) is not None: u.value = (self.width, self.height)
+
+    def _render_post_process(self):
+        self.noise_tex.use(1)
+        # Debug mode keeps the original VHS -> Matrix -> CRT chain around for A/B comparison
+        if self.debug_mode or not self._compile_shader("fused"):
+            for name in ("vhs", "matrix"): self._compile_shader(name)
+            self._ensure_post_targets()
+            self.fbo.use(); self.ctx.clear(0, 0, 0, 0); self.ui_texture.use(0); self.blit_vaos["vhs"].render(moderngl.TRIANGLE_STRIP)
+            # A matrix pass this weak would be invisible, so CRT reads the VHS output directly
+            src = self.temp_texture
+            if self.post_process_intensity >= MATRIX_MIN_INTENSITY:
+                self.fbo2.use(); self.ctx.clear(0, 0, 0, 0); src.use(0); self.screen_vaos["matrix"].render(moderngl.TRIANGLE_STRIP); src = self.temp_texture2
+            self.ctx.screen.use(); self.ctx.viewport = (0, 0, self.width, self.height); self.ctx.clear(0, 0, 0, 1); src.use(0); self.screen_vaos["crt"].render(moderngl.TRIANGLE_STRIP)
+            return
+        self.ctx.screen.use(); self.ctx.clear(0, 0, 0, 1); self.ui_texture.use(0)
+        # Below the threshold (including idle, intensity 0) the matrix stage is pass-through; VHS still adds its chroma split and wobble
+        if self.post_process_intensity < MATRIX_MIN_INTENSITY and self._compile_shader("fused_vhs"): self.screen_vaos["fused_vhs"].render(moderngl.TRIANGLE_STRIP)
+        else: self.screen_vaos["fused"].render(moderngl.TRIANGLE_STRIP)
 
     def add_component(self, comp: Component):
         comp.on_init(self.ctx, self.surface.getCanvas())
-        self.components.append(comp)
+        self.components.append(comp); self._dispatch_order = self.components[::-1]
 
     def run_heartbeat(self):
         now = time.perf_counter()
         if now - self.last_heartbeat >= 5.0: self.last_heartbeat = now
+        if self._shader_srcs: self._compile_shader(next(iter(self._shader_srcs)))
 
     def run(self):
         self.last_time = time.perf_counter()
@@ -174,11 +289,11 @@ class CoreEngine:
             for comp in self.components:
                 if comp.enabled: comp.on_update(dt)
 
-            canvas = self.surface.getCanvas()
-            canvas.clear(skia.ColorTRANSPARENT)
+            canvas = self.begin_ui_frame()
             for comp in self.components:
                 if comp.enabled: comp.on_render_ui(canvas)
             self._render_fps(canvas)
+            self.end_ui_frame()
 
             self._update_shader_uniforms(dt)
             self._upload_skia_to_texture()
@@ -186,11 +301,8 @@ class CoreEngine:
             self.ctx.enable(moderngl.BLEND)
             self.ctx.blend_func = (moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA)
 
-            # Blit passes (VHS -> Matrix -> Screen)
-            self.fbo.use(); self.ctx.clear(0, 0, 0, 0); self.ui_texture.use(0); self.blit_vaos["vhs"].render(moderngl.TRIANGLE_STRIP)
-            self.fbo2.use(); self.ctx.clear(0, 0, 0, 0); self.temp_texture.use(0); self.screen_vaos["matrix"].render(moderngl.TRIANGLE_STRIP)
-            self.ctx.screen.use(); self.ctx.clear(0, 0, 0, 1); self.temp_texture2.use(0); self.screen_vaos["crt"].render(moderngl.TRIANGLE_STRIP)
+            self._render_post_process()
 
-            glfw.swap_buffers(self.window); glfw.poll_events(); self.run_heartbeat()
+            glfw.swap_buffers(self.window); self.poll_events(); self.run_heartbeat()
 
         glfw.terminate()
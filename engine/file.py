@@ -1,7 +1,8 @@
 import json, os, sys
 import xml.etree.ElementTree as ET
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 import skia
+from engine.sprite import Rect
 from lib import tlog
 
 def resource_path(relative_path):
@@ -12,13 +13,23 @@ def resource_path(relative_path):
 @dataclass
 class SpriteSheet:
     image: skia.Image; frame_width: int; frame_height: int; offset: int; rows: int; cols: int
+    src_rects: list = field(init=False, repr=False)
+    _frames: dict = field(init=False, repr=False, default_factory=dict)
+    def __post_init__(self):
+        # Frame rects are computed once; draw with Sprite(sheet.image, sheet.get_src_rect(i)) instead of makeSubset per call
+        fw, fh, off = self.frame_width, self.frame_height, self.offset
+        self.src_rects = [Rect(c * (fw + off), r * (fh + off), fw, fh) for r in range(self.rows) for c in range(self.cols)]
+    def get_src_rect(self, index: int):
+        return self.src_rects[index] if 0 <= index < len(self.src_rects) else None
     def get_frame(self, index: int) -> skia.Image:
-        c, r = index % self.cols, index // self.cols
-        subset = skia.IRect.MakeXYWH(c * (self.frame_width + self.offset), r * (self.frame_height + self.offset), self.frame_width, self.frame_height)
-        return self.image.makeSubset(subset)
+        # Kept for callers that want a standalone image; each subset is made once on first request
+        if (img := self._frames.get(index)) is None and (r := self.get_src_rect(index)) is not None:
+            img = self._frames[index] = self.image.makeSubset(skia.IRect.MakeXYWH(int(r.x), int(r.y), int(r.w), int(r.h)))
+        return img
 
 class FileManager:
     _instance = None
+    def __init__(self): self._image_cache = {}
     @classmethod
     def get(cls):
         if cls._instance is None: cls._instance = FileManager()
@@ -27,14 +38,23 @@ class FileManager:
         try:
             with open(resource_path(path), "r") as f: return json.load(f)
         except Exception as e: tlog.err(f"FileManager: JSON fail {path}: {e}"); return None
-    def load_xml(self, path):
-        try: return ET.parse(resource_path(path)).getroot()
+    def load_xml(self, path, on_element=None):
+        # With on_element, stream the file and hand each element over as it closes, then drop its
+        # contents; the returned root is emptied. Without it, return the full tree as before.
+        try:
+            if on_element is None: return ET.parse(resource_path(path)).getroot()
+            root = None
+            for _, el in ET.iterparse(resource_path(path), events=("end",)): on_element(el); el.clear(); root = el
+            return root
         except Exception as e: tlog.err(f"FileManager: XML fail {path}: {e}"); return None
     def load_image(self, path):
         fp = resource_path(path)
+        if fp in self._image_cache: return self._image_cache[fp]
         if not os.path.exists(fp): return None
-        try: return skia.Image.MakeFromEncoded(skia.Data.MakeFromFileName(fp))
+        # MakeFromEncoded is lazy; rasterize once so draws never re-decode the PNG
+        try: img = skia.Image.MakeFromEncoded(skia.Data.MakeFromFileName(fp)).makeRasterImage()
         except Exception as e: tlog.err(f"FileManager: Image fail {path}: {e}"); return None
+        self._image_cache[fp] = img; return img
     def load_spritesheet(self, path, frame_w, frame_h, offset=0):
         img = self.load_image(path)
         if not img: return None
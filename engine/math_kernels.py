@@ -0,0 +1,24 @@
+from engine.collision_kernels import HAS_NUMBA, njit
+
+@njit(cache=True, fastmath=True)
+def dist_pt_seg_sq(px, py, ax, ay, bx, by):
+    # Squared distance, for threshold tests that can skip the sqrt
+    dx, dy = bx - ax, by - ay
+    l2 = dx * dx + dy * dy
+    t = 0.0 if l2 == 0.0 else ((px - ax) * dx + (py - ay) * dy) / l2
+    t = 0.0 if t < 0.0 else (1.0 if t > 1.0 else t)
+    ex, ey = px - (ax + dx * t), py - (ay + dy * t)
+    return ex * ex + ey * ey
+
+@njit(cache=True, fastmath=True)
+def count_seg_hits(px, py, seg, n, radius):
+    # Number of the first n segments (rows of x0, y0, x1, y1) passing within radius of (px, py)
+    hits, r2 = 0, radius * radius
+    for i in range(n):
+        if dist_pt_seg_sq(px, py, seg[i, 0], seg[i, 1], seg[i, 2], seg[i, 3]) < r2: hits += 1
+    return hits
+
+# Compile on import so the first boss fight does not stall on the JIT
+if HAS_NUMBA:
+    import numpy as np
+    count_seg_hits(0.0, 0.0, np.zeros((1, 4)), 1, 1.0)
@@ -1,25 +1,66 @@
-import random, math, skia
-from dataclasses import dataclass
-from engine.physics import Vec2
+import skia
+import numpy as np
 
-@dataclass
-class Particle:
-    pos: Vec2; vel: Vec2; life: float; max_life: float; col: int; sz: float; gravity: float = 500.0
+# Emit directions are drawn from a fixed table instead of calling cos/sin per particle
+_ANG_N = 4096
+_ANG = np.linspace(0, 2 * np.pi, _ANG_N, endpoint=False)
+_COS, _SIN = np.cos(_ANG).astype(np.float32), np.sin(_ANG).astype(np.float32)
 
 class ParticleSystem:
-    def __init__(self):
-        self.particles = []
+    # Particles are stored as SoA arrays; only the first self.count slots are live
+    _FIELDS = (("pos", (2,), np.float32), ("vel", (2,), np.float32), ("life", (), np.float32), ("max_life", (), np.float32),
+               ("size", (), np.float32), ("gravity", (), np.float32), ("col", (), np.uint32))
+    _SPRITE_R = 16
+
+    def __init__(self, capacity=1024):
+        self.count = 0
+        for name, shape, dtype in self._FIELDS: setattr(self, name, np.empty((capacity,) + shape, dtype=dtype))
         self.paint = skia.Paint(Style=skia.Paint.kFill_Style, AntiAlias=True)
+        # One white circle sprite, tinted and scaled per particle by drawAtlas
+        surf = skia.Surface(2 * self._SPRITE_R, 2 * self._SPRITE_R)
+        surf.getCanvas().drawCircle(self._SPRITE_R, self._SPRITE_R, self._SPRITE_R, skia.Paint(Color=skia.ColorWHITE, AntiAlias=True))
+        self.sprite = surf.makeImageSnapshot()
+        self._sprite_rect = skia.Rect.MakeWH(2 * self._SPRITE_R, 2 * self._SPRITE_R)
+    def _reserve(self, n):
+        cap = len(self.life)
+        if n <= cap: return
+        cap = max(cap, 1) # doubling from an empty buffer would never grow
+        while cap < n: cap *= 2
+        for name, shape, dtype in self._FIELDS:
+            buf = np.empty((cap,) + shape, dtype=dtype); buf[:self.count] = getattr(self, name)[:self.count]; setattr(self, name, buf)
     def emit(self, pos, count, color, speed_range=(50, 200), life_range=(0.3, 0.8), size_range=(2, 6), gravity=500.0):
-        for _ in range(count):
-            s = random.uniform(*speed_range); a = random.uniform(0, math.pi * 2); l = random.uniform(*life_range)
-            self.particles.append(Particle(pos.copy(), Vec2(math.cos(a)*s, math.sin(a)*s), l, l, color, random.uniform(*size_range), gravity))
+        self._spawn((pos.x, pos.y), count, color, speed_range, life_range, size_range, gravity)
+    def emit_many(self, positions, count, color, speed_range=(50, 200), life_range=(0.3, 0.8), size_range=(2, 6), gravity=500.0):
+        # count particles from every point in positions (Vec2s or an (N, 2) array) in one batch
+        if not len(positions): return
+        xy = positions if isinstance(positions, np.ndarray) else np.array([(p.x, p.y) for p in positions], dtype=np.float32)
+        self._spawn(np.repeat(xy, count, axis=0), len(xy) * count, color, speed_range, life_range, size_range, gravity)
+    def _spawn(self, xy, count, color, speed_range, life_range, size_range, gravity):
+        if count <= 0: return
+        self._reserve(self.count + count); s = slice(self.count, self.count + count)
+        spd, idx, l = np.random.uniform(*speed_range, count).astype(np.float32), np.random.randint(0, _ANG_N, count), np.random.uniform(*life_range, count)
+        self.pos[s] = xy; self.vel[s, 0] = _COS[idx] * spd; self.vel[s, 1] = _SIN[idx] * spd
+        self.life[s] = l; self.max_life[s] = l; self.size[s] = np.random.uniform(*size_range, count)
+        self.gravity[s] = gravity; self.col[s] = color
+        self.count += count
     def update(self, dt):
-        for pt in self.particles[:]:
-            pt.life -= dt; pt.pos = pt.pos + pt.vel * dt; pt.vel.y += pt.gravity * dt
-            if pt.life <= 0: self.particles.remove(pt)
+        n = self.count
+        if not n: return
+        life, pos, vel = self.life[:n], self.pos[:n], self.vel[:n]
+        life -= dt; pos += vel * dt; vel[:, 1] += self.gravity[:n] * dt
+        alive = life > 0
+        if alive.all(): return
+        # Stable compaction keeps draw order the same as before
+        k = int(np.count_nonzero(alive))
+        for name, _, _ in self._FIELDS:
+            a = getattr(self, name); a[:k] = a[:n][alive]
+        self.count = k
     def render(self, canvas):
-        for pt in self.particles:
-            col = skia.Color4f.FromColor(pt.col); col.fA = pt.life / pt.max_life
-            self.paint.setColor4f(col)
-            canvas.drawCircle(pt.pos.x, pt.pos.y, pt.sz, self.paint)
+        n = self.count
+        if not n: return
+        scale = self.size[:n] / self._SPRITE_R
+        tx, ty = self.pos[:n, 0] - scale * self._SPRITE_R, self.pos[:n, 1] - scale * self._SPRITE_R
+        alpha = (np.clip(self.life[:n] / self.max_life[:n], 0.0, 1.0) * 255).astype(np.uint32)
+        colors = ((alpha << 24) | (self.col[:n] & 0xFFFFFF)).tolist()
+        xforms = [skia.RSXform(s, 0.0, x, y) for s, x, y in zip(scale.tolist(), tx.tolist(), ty.tolist())]
+        canvas.drawAtlas(self.sprite, xforms, [self._sprite_rect] * n, colors, skia.BlendMode.kModulate, paint=self.paint)
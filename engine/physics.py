@@ -1,6 +1,8 @@
 import math
 from dataclasses import dataclass, field
 from typing import List
+import numpy as np
+from engine.collision_kernels import HAS_NUMBA, njit
 
 @dataclass
 class Vec2:
@@ -17,6 +19,10 @@ class Vec2:
         ln = self.length()
         return Vec2(self.x / ln, self.y / ln) if ln > 0 else Vec2(0, 0)
     def copy(self): return Vec2(self.x, self.y)
+    # In-place variants for hot loops; they return self and allocate nothing
+    def zero_(self): self.x = self.y = 0.0; return self
+    def iadd_(self, o, s=1.0): self.x += o.x * s; self.y += o.y * s; return self
+    def imul_(self, s): self.x *= s; self.y *= s; return self
 
 @dataclass
 class RigidBody:
@@ -27,27 +33,79 @@ class RigidBody:
     drag: float = 0.01
     restitution: float = 0.8
     is_static: bool = False
+    inv_mass: float = field(init=False, repr=False, default=0.0)
+
+    def set_mass(self, mass): self.mass = mass
+
+    def _sync_inv_mass(self):
+        # Static and massless bodies both get inv_mass 0, i.e. they never move under forces or impulses
+        m, static = self.__dict__.get("_mass", 0.0), self.__dict__.get("_is_static", False)
+        self.inv_mass = 0.0 if static or not m else 1.0 / m
 
     def apply_force(self, force):
-        if not self.is_static: self.acceleration = self.acceleration + force * (1.0 / self.mass)
+        if not self.is_static: self.acceleration.iadd_(force, self.inv_mass)
 
     def update(self, dt):
         if self.is_static: return
-        self.velocity = self.velocity * (1.0 - self.drag)
-        self.velocity = self.velocity + self.acceleration * dt
-        self.position = self.position + self.velocity * dt
-        self.acceleration = Vec2(0, 0)
+        # Component-wise in place: no Vec2 temporaries per body per frame
+        p, v, a, k = self.position, self.velocity, self.acceleration, 1.0 - self.drag
+        v.x = v.x * k + a.x * dt; v.y = v.y * k + a.y * dt
+        p.x += v.x * dt; p.y += v.y * dt
+        a.zero_()
+
+def _inv_mass_synced(name):
+    key = "_" + name
+    def fset(self, value): self.__dict__[key] = value; self._sync_inv_mass()
+    return property(lambda self: self.__dict__[key], fset)
+
+# Installed after the dataclass is built so mass/is_static stay ordinary init fields, while any later
+# assignment (body.mass = x, body.is_static = True) refreshes the cached inv_mass
+RigidBody.mass, RigidBody.is_static = _inv_mass_synced("mass"), _inv_mass_synced("is_static")
+
+@njit(cache=True, fastmath=True)
+def _integrate(px, py, vx, vy, ax, ay, keep, stat, gx, gy, dt):
+    for i in range(px.shape[0]):
+        if stat[i]: continue
+        vx[i] = vx[i] * keep[i] + (ax[i] + gx) * dt; vy[i] = vy[i] * keep[i] + (ay[i] + gy) * dt
+        px[i] += vx[i] * dt; py[i] += vy[i] * dt
 
 class PhysicsWorld:
+    # Below this many bodies, gathering into arrays costs more than the JIT loop saves
+    JIT_MIN_BODIES = 64
+
     def __init__(self, gravity=None):
         self.gravity = gravity or Vec2(0, 0)
         self.bodies = []
+        self._slot = {} # id(body) -> index in self.bodies
 
-    def add_body(self, b): self.bodies.append(b)
+    def add_body(self, b):
+        if id(b) not in self._slot: self._slot[id(b)] = len(self.bodies); self.bodies.append(b)
     def remove_body(self, b):
-        if b in self.bodies: self.bodies.remove(b)
+        # Swap with the last body and pop: O(1), body order is irrelevant to integration
+        i = self._slot.pop(id(b), None)
+        if i is None: return
+        last = self.bodies.pop()
+        if last is not b: self.bodies[i] = last; self._slot[id(last)] = i
 
     def update(self, dt):
+        if HAS_NUMBA and len(self.bodies) >= self.JIT_MIN_BODIES: return self._update_jit(dt)
+        g = self.gravity
         for b in self.bodies:
-            if not b.is_static: b.apply_force(self.gravity * b.mass)
-            b.update(dt)
\ No newline at end of file
+            # gravity * mass * inv_mass == gravity, so skip the force round-trip
+            if not b.is_static: b.acceleration.iadd_(g)
+            b.update(dt)
+
+    def _update_jit(self, dt):
+        bodies, n = self.bodies, len(self.bodies)
+        px = np.fromiter((b.position.x for b in bodies), dtype=np.float64, count=n)
+        py = np.fromiter((b.position.y for b in bodies), dtype=np.float64, count=n)
+        vx = np.fromiter((b.velocity.x for b in bodies), dtype=np.float64, count=n)
+        vy = np.fromiter((b.velocity.y for b in bodies), dtype=np.float64, count=n)
+        ax = np.fromiter((b.acceleration.x for b in bodies), dtype=np.float64, count=n)
+        ay = np.fromiter((b.acceleration.y for b in bodies), dtype=np.float64, count=n)
+        keep = np.fromiter((1.0 - b.drag for b in bodies), dtype=np.float64, count=n)
+        stat = np.fromiter((b.is_static for b in bodies), dtype=np.bool_, count=n)
+        _integrate(px, py, vx, vy, ax, ay, keep, stat, self.gravity.x, self.gravity.y, dt)
+        for b, x, y, u, v in zip(bodies, px.tolist(), py.tolist(), vx.tolist(), vy.tolist()):
+            if b.is_static: continue
+            b.position.x, b.position.y, b.velocity.x, b.velocity.y = x, y, u, v; b.acceleration.zero_()
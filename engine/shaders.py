@@ -1,3 +1,6 @@
+# rand() reads one texel of a 256x256 noise texture (NEAREST, REPEAT, unit 1) instead of hashing with sin();
+# its argument is a lattice cell, so per-pixel grain is keyed on gl_FragCoord and stepped at 60 Hz.
+# time_block = floor(time * (10, 15, 60)) is computed once per frame on the CPU for the block-stepped effects.
 DEFAULT_VERT = """
 #version 330
 in vec2 in_pos; in vec2 in_uv; out vec2 uv;
@@ -12,19 +15,19 @@ void main() { fragColor = texture(tex, uv); }
 
 GLITCH_FRAG = """
 #version 330
-in vec2 uv; out vec4 fragColor; uniform sampler2D tex; uniform float time; uniform float intensity;
-float rand(vec2 co){ return fract(sin(dot(co.xy ,vec2(12.9898,78.233))) * 43758.5453); }
+in vec2 uv; out vec4 fragColor; uniform sampler2D tex; uniform float time; uniform float intensity; uniform vec3 time_block;
+uniform sampler2D noise_tex; float rand(vec2 co){ return texture(noise_tex, (floor(co) + 0.5) * (1.0 / 256.0)).r; }
 void main() {
     vec2 t_uv = uv;
-    if (intensity > 0.01) {
-        float b_sz = 0.05 + (0.1 * (1.0 - intensity)); vec2 block = floor(uv / b_sz);
-        if (rand(block + floor(time * 10.0)) < intensity * 0.3) t_uv.x += (rand(block) - 0.5) * intensity * 0.5;
-    }
+    float b_sz = 0.05 + (0.1 * (1.0 - intensity)); vec2 block = floor(uv / b_sz);
+    float jit = step(0.01, intensity) * step(rand(block + time_block.x), intensity * 0.3);
+    t_uv.x += (rand(block) - 0.5) * intensity * 0.5 * jit;
+    vec4 c = texture(tex, t_uv);
     float r = texture(tex, t_uv + vec2(intensity * 0.02, 0.0)).r;
-    float g = texture(tex, t_uv).g;
+    float g = c.g;
     float b = texture(tex, t_uv - vec2(intensity * 0.02, 0.0)).b;
-    if (intensity > 0.5) { float scan = sin(uv.y * 800.0) * 0.1; r -= scan; g -= scan; b -= scan; }
-    fragColor = vec4(r, g, b, texture(tex, t_uv).a);
+    float scan = sin(uv.y * 800.0) * 0.1 * step(0.5, intensity); r -= scan; g -= scan; b -= scan;
+    fragColor = vec4(r, g, b, c.a);
 }
 """
 
@@ -42,30 +45,72 @@ void main() {
 
 VHS_FRAG = """
 #version 330
-in vec2 uv; out vec4 fragColor; uniform sampler2D tex; uniform float time; uniform float intensity;
-float rand(vec2 co){ return fract(sin(dot(co.xy, vec2(12.9898,78.233))) * 43758.5453); }
+in vec2 uv; out vec4 fragColor; uniform sampler2D tex; uniform float time; uniform float intensity; uniform vec3 time_block;
+uniform sampler2D noise_tex; float rand(vec2 co){ return texture(noise_tex, (floor(co) + 0.5) * (1.0 / 256.0)).r; }
 void main() {
     vec2 t_uv = uv; t_uv.x += sin(0.3 * time + t_uv.y * 21.0) * 0.002 * (1.0 + intensity * 5.0);
-    if (intensity > 0.3) {
-        vec2 block = floor(t_uv * 10.0);
-        if (rand(block + floor(time * 15.0)) < (intensity - 0.2) * 0.4) t_uv += (rand(block) - 0.5) * 0.1 * intensity;
-    }
+    vec2 block = floor(t_uv * 10.0);
+    float jit = step(0.3, intensity) * step(rand(block + time_block.y), (intensity - 0.2) * 0.4);
+    t_uv += (rand(block) - 0.5) * 0.1 * intensity * jit;
     float off = 0.002 + 0.02 * intensity;
-    vec3 col = vec3(texture(tex, t_uv + vec2(off, 0.0)).r, texture(tex, t_uv).g, texture(tex, t_uv - vec2(off, 0.0)).b) + rand(uv + time) * 0.15 * intensity;
-    if (intensity > 0.6) col = mix(col, vec3(dot(col, vec3(0.299, 0.587, 0.114))), (intensity - 0.6) * 2.0);
-    fragColor = vec4(col, texture(tex, t_uv).a);
+    vec4 c = texture(tex, t_uv);
+    vec3 col = vec3(texture(tex, t_uv + vec2(off, 0.0)).r, c.g, texture(tex, t_uv - vec2(off, 0.0)).b) + rand(gl_FragCoord.xy + time_block.z * vec2(37.0, 17.0)) * 0.15 * intensity;
+    col = mix(col, vec3(dot(col, vec3(0.299, 0.587, 0.114))), clamp((intensity - 0.6) * 2.0, 0.0, 1.0));
+    fragColor = vec4(col, c.a);
 }
 """
 
+# Below this intensity the engine skips the MATRIX stage on the CPU instead of branching per fragment
+MATRIX_MIN_INTENSITY = 0.05
 MATRIX_FRAG = """
 #version 330
 in vec2 uv; out vec4 fragColor; uniform sampler2D tex; uniform float time; uniform float intensity;
 void main() {
-    if (intensity < 0.05) { fragColor = texture(tex, uv); return; }
     float l_id = floor(uv.y * 12.0);
     vec2 t_uv = uv; t_uv.x += sin(time * (fract(l_id * 0.456) - 0.5) * 2.0 + l_id) * 0.05 * intensity;
     float off = 0.002 * intensity;
-    vec3 col = vec3(texture(tex, t_uv + vec2(off, 0.0)).r, texture(tex, t_uv).g, texture(tex, t_uv - vec2(off, 0.0)).b);
-    fragColor = vec4(col * mix(vec3(1.0), vec3(0.8, 1.2, 0.8), intensity * 0.4), texture(tex, t_uv).a);
+    vec4 c = texture(tex, t_uv);
+    vec3 col = vec3(texture(tex, t_uv + vec2(off, 0.0)).r, c.g, texture(tex, t_uv - vec2(off, 0.0)).b);
+    fragColor = vec4(col * mix(vec3(1.0), vec3(0.8, 1.2, 0.8), intensity * 0.4), c.a);
+}
+"""
+# VHS -> MATRIX -> CRT in one pass. Each stage is a function of the previous one's output coordinate, so the
+# intermediate framebuffers are never written; the clamps and fract() reproduce the 8-bit, REPEAT-sampled
+# intermediates of the multi-pass chain.
+FUSED_FRAG = """
+#version 330
+in vec2 uv; out vec4 fragColor; uniform sampler2D tex; uniform float time; uniform float intensity; uniform vec3 time_block;
+uniform sampler2D noise_tex; float rand(vec2 co){ return texture(noise_tex, (floor(co) + 0.5) * (1.0 / 256.0)).r; }
+vec4 vhs(vec2 p) {
+    vec2 s_uv = vec2(fract(p.x), 1.0 - fract(p.y));
+    vec2 t_uv = s_uv; t_uv.x += sin(0.3 * time + t_uv.y * 21.0) * 0.002 * (1.0 + intensity * 5.0);
+    vec2 block = floor(t_uv * 10.0);
+    float jit = step(0.3, intensity) * step(rand(block + time_block.y), (intensity - 0.2) * 0.4);
+    t_uv += (rand(block) - 0.5) * 0.1 * intensity * jit;
+    float off = 0.002 + 0.02 * intensity;
+    vec4 c = texture(tex, t_uv);
+    vec3 col = vec3(texture(tex, t_uv + vec2(off, 0.0)).r, c.g, texture(tex, t_uv - vec2(off, 0.0)).b) + rand(gl_FragCoord.xy + time_block.z * vec2(37.0, 17.0)) * 0.15 * intensity;
+    col = mix(col, vec3(dot(col, vec3(0.299, 0.587, 0.114))), clamp((intensity - 0.6) * 2.0, 0.0, 1.0));
+    return clamp(vec4(col, c.a), 0.0, 1.0);
+}
+vec4 matrix(vec2 m_uv) {
+    float l_id = floor(m_uv.y * 12.0);
+    vec2 t_uv = m_uv; t_uv.x += sin(time * (fract(l_id * 0.456) - 0.5) * 2.0 + l_id) * 0.05 * intensity;
+    float off = 0.002 * intensity;
+    vec4 mid = vhs(t_uv);
+    vec3 col = vec3(vhs(t_uv + vec2(off, 0.0)).r, mid.g, vhs(t_uv - vec2(off, 0.0)).b);
+    return clamp(vec4(col * mix(vec3(1.0), vec3(0.8, 1.2, 0.8), intensity * 0.4), mid.a), 0.0, 1.0);
 }
-"""
\ No newline at end of file
+void main() {
+    vec2 p = uv * 2.0 - 1.0; p += p * dot(p, p) * 0.1;
+    if (abs(p.x) > 1.0 || abs(p.y) > 1.0) { fragColor = vec4(0,0,0,1); return; }
+    vec2 tc = (p + 1.0) * 0.5; vec4 col = matrix(tc);
+    col.rgb *= (sin(tc.y * 600.0) * 0.1 + 0.9) * (1.0 - dot(p, p) * 0.2);
+    fragColor = col;
+}
+"""
+# FUSED without the MATRIX stage, used while intensity is below MATRIX_MIN_INTENSITY
+FUSED_VHS_FRAG = FUSED_FRAG.replace("vec4 col = matrix(tc);", "vec4 col = vhs(tc);")
+
+# Every post-process program by name, all sharing DEFAULT_VERT
+SHADERS = {"default": DEFAULT_FRAG, "glitch": GLITCH_FRAG, "crt": CRT_FRAG, "vhs": VHS_FRAG, "matrix": MATRIX_FRAG, "fused": FUSED_FRAG, "fused_vhs": FUSED_VHS_FRAG}
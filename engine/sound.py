@@ -1,7 +1,9 @@
 import os, threading, time, sys
+from concurrent.futures import Future, ThreadPoolExecutor
 import numpy as np
 from lib import tlog
 from engine.file import resource_path
+from engine.collision_kernels import HAS_NUMBA, njit
 
 BACKEND = None
 try:
@@ -10,14 +12,45 @@ except:
     try: import miniaudio; BACKEND = "miniaudio"
     except: BACKEND = None
 
+try: from scipy.signal import lfilter
+except ImportError: lfilter = None
+
+@njit(cache=True, fastmath=True)
+def _mix_voice(buf, samples, offset, loop, gain, alpha, last_y, lp):
+    # Reads, scales, low-passes and accumulates one voice's next len(buf) interleaved samples in a single pass.
+    # Returns the new offset, or -1 once a one-shot voice has run out (the rest of its block is silence).
+    total, nch = samples.shape[0], last_y.shape[0]
+    for k in range(buf.shape[0]):
+        if offset >= total and loop: offset = 0
+        x = 0.0
+        if offset < total: x = samples[offset] * gain; offset += 1
+        if lp: c = k % nch; last_y[c] = alpha * x + (1.0 - alpha) * last_y[c]; x = last_y[c]
+        buf[k] += x
+    return offset if loop or offset < total else -1
+
+@njit(cache=True)
+def _to_int16(buf, out):
+    for k in range(buf.shape[0]): out[k] = min(max(buf[k], -32768.0), 32767.0)
+
+if HAS_NUMBA:
+    _mix_voice(np.zeros(2, dtype=np.float32), np.zeros(2, dtype=np.float32), 0, True, 1.0, 1.0, np.zeros(1, dtype=np.float32), True)
+    _to_int16(np.zeros(1, dtype=np.float32), np.zeros(1, dtype=np.int16))
+
+def _low_pass(x, last_y, alpha):
+    # One-pole IIR y[n] = a*x[n] + (1-a)*y[n-1] over an (N, nch) block, in place; last_y carries y[-1] between blocks
+    if lfilter is not None:
+        for c in range(x.shape[1]): x[:, c] = lfilter([alpha], [1.0, alpha - 1.0], x[:, c], zi=[(1.0 - alpha) * last_y[c]])[0]
+        last_y[:] = x[-1]; return
+    for n in range(x.shape[0]): last_y[:] = alpha * x[n] + (1.0 - alpha) * last_y; x[n] = last_y
+
 class Voice:
     def __init__(self, data, volume, loop, low_pass):
         self.data, self.volume, self.loop, self.lp_amount = data, volume, loop, max(0.0, min(1.0, low_pass))
         self.playing, self.offset = True, 0
-        try: self.samples = np.array(data.samples, dtype=np.int16)
-        except: self.samples = np.frombuffer(data.samples, dtype=np.int16)
+        self.samples = data._f32 # float32 copy of the int16 PCM, made once in SoundManager.load
         self.last_y = np.zeros(data.nchannels, dtype=np.float32)
-        self.alpha = 1.0 - (self.lp_amount * 0.95)
+        self.scratch = np.empty(0, dtype=np.float32) # reused for loop wrap-around, grown on demand
+        self.alpha = 1.0 - (self.lp_amount * 0.95); self.has_lp = self.lp_amount > 0.01
     def stop(self): self.playing = False
 
 class SoundHandle:
@@ -31,13 +64,20 @@ class SoundManager:
     _instance = None
     def __init__(self):
         self.sounds, self.volume, self.active_voices = {}, 1.0, []
+        self._lp_active_count = 0 # live voices with a low-pass; while 0 the mixer never touches the filter
         self._lock, self._device, self._gen = threading.Lock(), None, None
+        self._loader = ThreadPoolExecutor(max_workers=2, thread_name_prefix="sound-load")
 
     @classmethod
     def get(cls):
         if cls._instance is None: cls._instance = SoundManager()
         return cls._instance
 
+    def _drop_finished(self):
+        # Caller holds self._lock
+        self.active_voices = [v for v in self.active_voices if v.playing]
+        if self._lp_active_count: self._lp_active_count = sum(v.has_lp for v in self.active_voices)
+
     def _ensure_device(self, sr, nch):
         if self._device or BACKEND != "miniaudio": return
         import miniaudio
@@ -45,50 +85,82 @@ class SoundManager:
             self._device = miniaudio.PlaybackDevice(sample_rate=sr, nchannels=nch)
             def mixer_gen(mgr):
                 req = yield b""
+                # Mix and output buffers persist across callbacks and only grow when the device asks for more frames
+                buf_f, out_i = np.empty(0, dtype=np.float32), np.empty(0, dtype=np.int16)
                 while True:
                     if not req or req <= 0: req = yield b""; continue
-                    buf = np.zeros(req * nch, dtype=np.float32)
+                    n = req * nch
+                    if len(buf_f) < n: buf_f, out_i = np.empty(n, dtype=np.float32), np.empty(n, dtype=np.int16)
+                    buf, out = buf_f[:n], out_i[:n]; buf.fill(0.0)
+                    if HAS_NUMBA:
+                        with mgr._lock:
+                            any_lp = mgr._lp_active_count > 0
+                            for v in mgr.active_voices:
+                                if not v.playing: continue
+                                if not len(v.samples): v.playing = False; continue
+                                v.offset = _mix_voice(buf, v.samples, v.offset, v.loop, v.volume * mgr.volume, v.alpha, v.last_y, any_lp and v.has_lp)
+                                if v.offset < 0: v.offset, v.playing = 0, False
+                            # One rebuild drops every finished voice instead of list.remove per voice
+                            mgr._drop_finished()
+                        _to_int16(buf, out)
+                        req = yield out.tobytes(); continue
                     with mgr._lock:
-                        for v in mgr.active_voices[:]:
-                            if not v.playing: mgr.active_voices.remove(v); continue
+                        any_lp = mgr._lp_active_count > 0
+                        for v in mgr.active_voices:
+                            if not v.playing: continue
                             end = v.offset + req * nch; chunk = None
                             if end > len(v.samples):
                                 if v.loop:
-                                    p1 = v.samples[v.offset:]; v.offset = (req * nch - len(p1)) % len(v.samples)
-                                    chunk = np.concatenate([p1, v.samples[:v.offset]])
+                                    p1 = v.samples[v.offset:]; n1 = len(p1); v.offset = (req * nch - n1) % len(v.samples)
+                                    if len(v.scratch) < req * nch: v.scratch = np.empty(req * nch, dtype=np.float32)
+                                    v.scratch[:n1] = p1; v.scratch[n1:n1 + v.offset] = v.samples[:v.offset]; chunk = v.scratch[:n1 + v.offset]
                                 else: chunk = v.samples[v.offset:]; v.playing = False
                             else: chunk = v.samples[v.offset:end]; v.offset = end
                             if chunk is not None and len(chunk) > 0:
                                 if len(chunk) < req * nch: chunk = np.pad(chunk, (0, req * nch - len(chunk)))
-                                c_f = chunk.astype(np.float32) * v.volume * mgr.volume
-                                if v.lp_amount > 0.01:
-                                    c_f = c_f.reshape(-1, nch)
-                                    for n in range(c_f.shape[0]): v.last_y = v.alpha * c_f[n] + (1.0 - v.alpha) * v.last_y; c_f[n] = v.last_y
-                                    c_f = c_f.flatten()
+                                c_f = chunk * (v.volume * mgr.volume)
+                                if any_lp and v.has_lp:
+                                    _low_pass(c_f.reshape(-1, nch), v.last_y, v.alpha)
                                 buf += c_f
-                    req = yield np.clip(buf, -32768, 32767).astype(np.int16).tobytes()
+                        mgr._drop_finished()
+                    np.clip(buf, -32768, 32767, out=buf); np.copyto(out, buf, casting="unsafe")
+                    req = yield out.tobytes()
             self._gen = mixer_gen(self); next(self._gen); self._device.start(self._gen)
         except Exception as e: print(f"[AUDIO] Error: {e}", file=sys.stderr)
 
     def load(self, path, name=None):
+        # Decoding runs on the loader pool; self.sounds holds the Future until play() first needs it
         if not BACKEND: return
         k = name or path
         if k in self.sounds: return
         fp = resource_path(path)
-        try:
-            if BACKEND == "pygame": self.sounds[k] = pygame.mixer.Sound(fp)
-            else:
-                import miniaudio; d = miniaudio.decode_file(fp); self.sounds[k] = d
-                self._ensure_device(d.sample_rate, d.nchannels)
-        except Exception as e: print(f"[AUDIO] Load error {fp}: {e}")
+        self.sounds[k] = self._loader.submit(self._decode, fp)
+
+    def _decode(self, fp):
+        if BACKEND == "pygame": return pygame.mixer.Sound(fp)
+        import miniaudio; d = miniaudio.decode_file(fp)
+        # Raw byte buffers are viewed directly; array.array('h') and lists go through asarray
+        raw = isinstance(d.samples, (bytes, bytearray, memoryview))
+        pcm = np.frombuffer(d.samples, dtype=np.int16) if raw else np.asarray(d.samples, dtype=np.int16)
+        d._f32 = pcm.astype(np.float32); return d
+
+    def _resolve(self, k, fut):
+        try: s = fut.result()
+        except Exception as e: print(f"[AUDIO] Load error {k}: {e}"); self.sounds.pop(k, None); return None
+        self.sounds[k] = s
+        if BACKEND == "miniaudio": self._ensure_device(s.sample_rate, s.nchannels)
+        return s
 
     def play(self, name, volume=1.0, loop=False, low_pass=0.0):
         if not BACKEND: return SoundHandle(None)
         s = self.sounds.get(name)
+        if isinstance(s, Future): s = self._resolve(name, s)
         if not s: return SoundHandle(None)
         if BACKEND == "pygame": s.set_volume(volume * self.volume); s.play(loops=-1 if loop else 0); return SoundHandle(None)
         v = Voice(s, volume, loop, low_pass)
-        with self._lock: self.active_voices.append(v)
+        with self._lock:
+            self.active_voices.append(v)
+            if v.has_lp: self._lp_active_count += 1
         return SoundHandle(v)
 
     def set_global_volume(self, v): self.volume = max(0.0, min(1.0, v))
\ No newline at end of file
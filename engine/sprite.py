@@ -1,67 +1,172 @@
 import math, skia
-from dataclasses import dataclass
+import numpy as np
+from dataclasses import dataclass, field
 from engine.physics import Vec2
 
+_RAD2DEG = 180.0 / math.pi
+
 @dataclass
-class Rect: x: float; y: float; w: float; h: float
+class Rect:
+    x: float; y: float; w: float; h: float
+    # Matching skia.Rect, built once and updated in place on read whenever the fields changed, so direct
+    # assignment to x/y/w/h can never leave it stale and draws never allocate one
+    _sk: skia.Rect = field(init=False, repr=False, compare=False)
+    _sk_key: tuple = field(init=False, repr=False, compare=False, default=None)
+    def __post_init__(self): self._sk = skia.Rect.MakeEmpty()
+    def set(self, x, y, w, h): self.x, self.y, self.w, self.h = x, y, w, h
+    @property
+    def sk(self):
+        if (key := (self.x, self.y, self.w, self.h)) != self._sk_key: self._sk.setXYWH(*key); self._sk_key = key
+        return self._sk
 
 class Sprite:
     def __init__(self, image, src_rect=None):
         self.image, self.src_rect = image, src_rect
         self.anchor, self.scale = Vec2(0.5, 0.5), Vec2(1.0, 1.0)
         self.rotation, self.flip_x, self.flip_y = 0.0, False, False
-        self.color, self.alpha = skia.ColorWHITE, 1.0
+        # The paint is kept across frames and only rebuilt when color or alpha actually change
+        self._paint, self._color, self._alpha, self._paint_dirty = skia.Paint(AntiAlias=True), skia.ColorWHITE, 1.0, True
+        self._dst, self._dst_key = skia.Rect.MakeEmpty(), None # local-space destination, rebuilt when size/anchor change
+        self._abs_dst = skia.Rect.MakeEmpty() # absolute destination for the untransformed fast path
+
+    @property
+    def rotation(self): return self._rotation
+    @rotation.setter
+    def rotation(self, r): self._rotation, self._rot_deg = r, r * _RAD2DEG # canvas.rotate wants degrees; convert once per change
+
+    @property
+    def color(self): return self._color
+    @color.setter
+    def color(self, c):
+        if c != self._color: self._color, self._paint_dirty = c, True
+
+    @property
+    def alpha(self): return self._alpha
+    @alpha.setter
+    def alpha(self, a):
+        if a != self._alpha: self._alpha, self._paint_dirty = a, True
+
+    def _sync_paint(self):
+        pa = self._paint; pa.setAlphaf(self._alpha)
+        pa.setColorFilter(skia.ColorFilters.Blend(self._color, skia.BlendMode.kModulate) if self._color != skia.ColorWHITE else None)
+        self._paint_dirty = False
 
-    def render(self, canvas, pos):
-        if not self.image: return
+    def cull_bounds(self, pos, view_rect):
+        # True when the sprite at pos lies entirely outside view_rect (a Rect). Tests the circle that holds the
+        # scaled sprite under any rotation, so a sprite is never culled while any corner could still be on screen.
+        w = self.src_rect.w if self.src_rect else self.image.width()
+        h = self.src_rect.h if self.src_rect else self.image.height()
+        ax, ay = self.anchor.x, self.anchor.y
+        r = math.hypot(w * abs(self.scale.x) * max(ax, 1.0 - ax), h * abs(self.scale.y) * max(ay, 1.0 - ay))
+        return pos.x + r < view_rect.x or pos.x - r > view_rect.x + view_rect.w or pos.y + r < view_rect.y or pos.y - r > view_rect.y + view_rect.h
+
+    def render(self, canvas, pos, view=None):
+        if not self.image or (view is not None and self.cull_bounds(pos, view)): return
         w = self.src_rect.w if self.src_rect else self.image.width()
         h = self.src_rect.h if self.src_rect else self.image.height()
-        canvas.save()
-        canvas.translate(pos.x, pos.y); canvas.rotate(math.degrees(self.rotation))
-        canvas.scale(-self.scale.x if self.flip_x else self.scale.x, -self.scale.y if self.flip_y else self.scale.y)
         dx, dy = -w * self.anchor.x, -h * self.anchor.y
-        pa = skia.Paint(AntiAlias=True); pa.setAlphaf(self.alpha)
-        if self.color != skia.ColorWHITE: pa.setColorFilter(skia.ColorFilters.Blend(self.color, skia.BlendMode.kModulate))
+        if self._paint_dirty: self._sync_paint()
+        pa, sx, sy = self._paint, self.scale.x, self.scale.y
+        # Untransformed sprites draw straight at their absolute position: no save/translate/rotate/scale/restore
+        if not self._rotation and sx == 1.0 and sy == 1.0 and not self.flip_x and not self.flip_y:
+            if self.src_rect: self._abs_dst.setXYWH(pos.x + dx, pos.y + dy, w, h); canvas.drawImageRect(self.image, self.src_rect.sk, self._abs_dst, pa)
+            else: canvas.drawImage(self.image, pos.x + dx, pos.y + dy, skia.SamplingOptions(), pa)
+            return
+        canvas.save()
+        canvas.translate(pos.x, pos.y)
+        if self._rotation: canvas.rotate(self._rot_deg)
+        canvas.scale(-sx if self.flip_x else sx, -sy if self.flip_y else sy)
         if self.src_rect:
-            src = skia.Rect(self.src_rect.x, self.src_rect.y, self.src_rect.x + self.src_rect.w, self.src_rect.y + self.src_rect.h)
-            canvas.drawImageRect(self.image, src, skia.Rect(dx, dy, dx + w, dy + h), pa)
+            if self._dst_key != (dx, dy, w, h): self._dst_key = (dx, dy, w, h); self._dst.setXYWH(dx, dy, w, h)
+            canvas.drawImageRect(self.image, self.src_rect.sk, self._dst, pa)
         else: canvas.drawImage(self.image, dx, dy, skia.SamplingOptions(), pa)
         canvas.restore()
 
 class PositionedSprite(Sprite):
-    def __init__(self, image, pos=Vec2(0, 0), src_rect=None):
-        super().__init__(image, src_rect); self.position = pos
-    def render(self, canvas, pos=None): super().render(canvas, pos if pos else self.position)
+    def __init__(self, image, pos=None, src_rect=None):
+        super().__init__(image, src_rect); self.position = pos if pos is not None else Vec2(0, 0)
+    def render(self, canvas, pos=None, view=None): super().render(canvas, pos if pos is not None else self.position, view)
 
 class AnimatedSprite(Sprite):
     def __init__(self, image, frame_w, frame_h, frame_dur=0.1):
         super().__init__(image); self.frame_width, self.frame_height, self.frame_duration = frame_w, frame_h, frame_dur
         self.cols, self.rows = image.width() // frame_w, image.height() // frame_h
         self.total_frames = self.cols * self.rows; self.current_frame, self.timer, self.playing, self.loop = 0, 0.0, True, True
-        self.animations, self.current_anim = {}, None; self._update_src_rect()
+        self.animations, self.current_anim, self._anim_sys = {}, None, None
+        # Pixel (x, y) of each frame's src rect, per animation, so frame changes need no divmod
+        self._frame_xy = {None: self._frames_xy(np.arange(self.total_frames, dtype=np.int32))}; self._update_src_rect()
+
+    def _frames_xy(self, idx):
+        return list(zip(((idx % self.cols) * self.frame_width).tolist(), ((idx // self.cols) * self.frame_height).tolist()))
 
-    def add_animation(self, name, frames): self.animations[name] = frames
+    def add_animation(self, name, frames):
+        self.animations[name] = np.asarray(frames, dtype=np.int32); self._frame_xy[name] = self._frames_xy(self.animations[name])
     def play(self, name, loop=True):
         if name not in self.animations or (self.current_anim == name and self.playing): return
         self.current_anim, self.loop, self.current_frame, self.playing, self.timer = name, loop, 0, True, 0.0
         self._update_src_rect()
+        if self._anim_sys: self._anim_sys.sync(self)
 
     def update(self, dt):
         if not self.playing: return
         self.timer += dt
         if self.timer >= self.frame_duration:
             self.timer = 0.0
-            if self.current_anim:
-                f = self.animations[self.current_anim]
-                self.current_frame += 1
-                if self.current_frame >= len(f):
-                    if self.loop: self.current_frame = 0
-                    else: self.current_frame = len(f) - 1; self.playing = False
-                idx = f[self.current_frame]
-            else: self.current_frame = (self.current_frame + 1) % self.total_frames; idx = self.current_frame
-            self._update_src_rect_by_idx(idx)
-
-    def _update_src_rect(self): self._update_src_rect_by_idx(self.animations[self.current_anim][self.current_frame] if self.current_anim else self.current_frame)
+            xy = self._frame_xy[self.current_anim]; n = len(xy)
+            self.current_frame += 1
+            if self.current_frame >= n:
+                if self.current_anim and not self.loop: self.current_frame = n - 1; self.playing = False
+                else: self.current_frame = 0
+            x, y = xy[self.current_frame]; self.src_rect.set(x, y, self.frame_width, self.frame_height)
+
+    def _update_src_rect(self): self._update_src_rect_by_idx(int(self.animations[self.current_anim][self.current_frame]) if self.current_anim else self.current_frame)
     def _update_src_rect_by_idx(self, idx):
         c, r = idx % self.cols, idx // self.cols
-        self.src_rect = Rect(c * self.frame_width, r * self.frame_height, self.frame_width, self.frame_height)
\ No newline at end of file
+        if self.src_rect is None: self.src_rect = Rect(c * self.frame_width, r * self.frame_height, self.frame_width, self.frame_height)
+        else: self.src_rect.set(c * self.frame_width, r * self.frame_height, self.frame_width, self.frame_height)
+
+class AnimationSystem:
+    # Advances the timers of every registered AnimatedSprite in one vectorized pass; registered sprites
+    # are driven from here and must not call update() themselves. Only sprites whose frame changes are touched.
+    def __init__(self):
+        self.sprites = []
+        self.timers, self.durations = np.zeros(0), np.zeros(0)
+        self.frames, self.counts = np.zeros(0, dtype=np.int32), np.zeros(0, dtype=np.int32)
+        self.playing, self.loop = np.zeros(0, dtype=bool), np.zeros(0, dtype=bool)
+
+    def add(self, sp):
+        if sp._anim_sys is self: return
+        sp._anim_sys, sp._anim_slot = self, len(self.sprites); self.sprites.append(sp)
+        for name in ("timers", "durations", "frames", "counts", "playing", "loop"):
+            a = getattr(self, name); setattr(self, name, np.append(a, np.zeros(1, dtype=a.dtype)))
+        self.sync(sp)
+
+    def remove(self, sp):
+        if sp._anim_sys is not self: return
+        i, last = sp._anim_slot, len(self.sprites) - 1
+        if i != last:
+            moved = self.sprites[i] = self.sprites[last]; moved._anim_slot = i
+            for name in ("timers", "durations", "frames", "counts", "playing", "loop"): a = getattr(self, name); a[i] = a[last]
+        self.sprites.pop(); sp._anim_sys = None
+        for name in ("timers", "durations", "frames", "counts", "playing", "loop"): setattr(self, name, getattr(self, name)[:last])
+
+    def sync(self, sp):
+        # Copies a sprite's playback state in after play() or a direct edit
+        i = sp._anim_slot
+        self.timers[i], self.durations[i], self.frames[i] = sp.timer, sp.frame_duration, sp.current_frame
+        self.counts[i], self.playing[i] = len(sp._frame_xy[sp.current_anim]), sp.playing
+        self.loop[i] = sp.loop or sp.current_anim is None
+
+    def update(self, dt):
+        if not self.sprites: return
+        t, f = self.timers, self.frames
+        t[self.playing] += dt
+        adv = self.playing & (t >= self.durations)
+        if not adv.any(): return
+        t[adv] = 0.0; f[adv] += 1
+        over = adv & (f >= self.counts)
+        hold = over & ~self.loop
+        f[over & self.loop] = 0; f[hold] = self.counts[hold] - 1; self.playing[hold] = False
+        for i in np.flatnonzero(adv).tolist():
+            sp = self.sprites[i]; sp.current_frame, sp.playing, sp.timer = int(f[i]), bool(self.playing[i]), 0.0
+            x, y = sp._frame_xy[sp.current_anim][sp.current_frame]; sp.src_rect.set(x, y, sp.frame_width, sp.frame_height)
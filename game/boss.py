@@ -1,10 +1,88 @@
 import random
 import math
 import skia
+import numpy as np
 from engine.physics import RigidBody, Vec2, PhysicsWorld
 from engine.collision import circle_vs_circle, rect_vs_rect
+from engine.math_kernels import HAS_NUMBA, count_seg_hits
+
+# sin/cos of each body circle's phase offset i; per frame sin(k*t + i) is then rebuilt by angle addition
+_SIN_I = [math.sin(i) for i in range(10)]
+_COS_I = [math.cos(i) for i in range(10)]
+
+class NoiseRays:
+    # Active noise rays as parallel arrays (segment x0, y0, x1, y1 plus timers); only the first n slots are live
+    def __init__(self, capacity=8):
+        self.n = 0
+        self.seg = np.zeros((capacity, 4))
+        self.timer = np.zeros(capacity)
+        self.max_t = np.zeros(capacity)
+
+    def __len__(self): return self.n
+
+    def add(self, start: Vec2, end: Vec2, duration: float):
+        if self.n == len(self.timer):
+            for name in ("seg", "timer", "max_t"):
+                a = getattr(self, name); setattr(self, name, np.concatenate((a, np.zeros_like(a))))
+        self.seg[self.n] = (start.x, start.y, end.x, end.y)
+        self.timer[self.n] = self.max_t[self.n] = duration
+        self.n += 1
+
+    def tick(self, dt: float):
+        # Counts every timer down and compacts out the expired rays, keeping the rest in order
+        n = self.n
+        t = self.timer[:n]; t -= dt
+        alive = t > 0
+        if alive.all(): return
+        k = int(np.count_nonzero(alive))
+        for a in (self.seg, self.timer, self.max_t): a[:k] = a[:n][alive]
+        self.n = k
+
+    def dist_sq_to(self, p: Vec2):
+        # Squared distance from p to every live segment at once
+        s = self.seg[:self.n]
+        ax, ay, dx, dy = s[:, 0], s[:, 1], s[:, 2] - s[:, 0], s[:, 3] - s[:, 1]
+        l2 = dx * dx + dy * dy
+        t = np.clip(((p.x - ax) * dx + (p.y - ay) * dy) / np.where(l2 > 0, l2, 1.0), 0.0, 1.0)
+        ex, ey = ax + dx * t - p.x, ay + dy * t - p.y
+        return ex * ex + ey * ey
+
+    def hits(self, p: Vec2, radius: float) -> int:
+        if not self.n: return 0
+        # Ray counts stay small, so a compiled scalar loop beats the array expression when numba is there
+        if HAS_NUMBA: return count_seg_hits(p.x, p.y, self.seg, self.n, radius)
+        return int(np.count_nonzero(self.dist_sq_to(p) < radius * radius))
+
+class Trail:
+    # One arrow's trail characters as parallel arrays (position, remaining life, index into the trail charset)
+    def __init__(self, capacity=32):
+        self.n = 0
+        self.pos = np.zeros((capacity, 2))
+        self.life = np.zeros(capacity)
+        self.cidx = np.zeros(capacity, dtype=np.uint8)
+
+    def __len__(self): return self.n
+
+    def add(self, pos: Vec2, cidx: int, life: float = 0.6):
+        if self.n == len(self.life):
+            for name in ("pos", "life", "cidx"):
+                a = getattr(self, name); setattr(self, name, np.concatenate((a, np.zeros_like(a))))
+        self.pos[self.n] = (pos.x, pos.y); self.life[self.n] = life; self.cidx[self.n] = cidx
+        self.n += 1
+
+    def tick(self, dt: float):
+        n = self.n
+        if not n: return
+        life = self.life[:n]; life -= dt
+        keep = life > 0
+        if keep.all(): return
+        k = int(np.count_nonzero(keep))
+        for a in (self.pos, self.life, self.cidx): a[:k] = a[:n][keep]
+        self.n = k
 
 class Boss:
+    BODY_SPRITE_R = 64
+
     def __init__(self, phys: PhysicsWorld, pos: Vec2):
         self.max_hp = 300 # Increased from 100
         self.hp = 300
@@ -21,7 +99,25 @@ class Boss:
         self.attack_timer = 2.0
         
         self.is_dead = False
-        self.noise_rays = [] # List of {'start': Vec2, 'end': Vec2, 'timer': float, 'max_t': float}
+        self.noise_rays = NoiseRays()
+        self._rng = np.random.default_rng() # render-time noise is drawn in one batch per frame
+        self._rand = random.Random() # scalar gameplay rolls, kept off the module-global random state
+        # Trail spawn rolls and characters come from a 4096-entry ring that is redrawn each time it wraps
+        self._trail_chars, self._trail_i = "01xfa7!&", 0
+        self._refill_trail_ring()
+        # Paints, mask filters and the trail font live as long as the boss; render only changes color/width/alpha
+        self._body_paint, self._bit_paint = skia.Paint(AntiAlias=True), skia.Paint(Color=skia.ColorWHITE)
+        # One white circle sprite; the body's circles are tinted, placed and scaled by a single drawAtlas
+        surf = skia.Surface(2 * self.BODY_SPRITE_R, 2 * self.BODY_SPRITE_R)
+        surf.getCanvas().drawCircle(self.BODY_SPRITE_R, self.BODY_SPRITE_R, self.BODY_SPRITE_R, skia.Paint(Color=skia.ColorWHITE, AntiAlias=True))
+        self._body_sprite, self._body_rect = surf.makeImageSnapshot(), skia.Rect.MakeWH(2 * self.BODY_SPRITE_R, 2 * self.BODY_SPRITE_R)
+        self._atk_paint = skia.Paint(Color=skia.Color(0, 255, 0), StrokeWidth=3, Style=skia.Paint.kStroke_Style)
+        # Arrow glows are stroked sharp into one layer and blurred once when it is restored
+        self._glow_paint = skia.Paint(Color=skia.Color(50, 255, 50, 150), StrokeWidth=10, Style=skia.Paint.kStroke_Style)
+        self._glow_layer_paint = skia.Paint(ImageFilter=skia.ImageFilters.Blur(4, 4))
+        self._trail_font, self._trail_paint = skia.Font(skia.Typeface.MakeDefault(), 16), skia.Paint(Color=skia.Color(0, 255, 0, 180), AntiAlias=True)
+        self._ray_paint = skia.Paint(MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 6))
+        self._inner_ray_paint = skia.Paint(StrokeWidth=3, AntiAlias=True)
 
     def update(self, dt: float, player, particles, audio):
         if self.is_dead:
@@ -31,7 +127,8 @@ class Boss:
             self.freeze_timer -= dt
             return 0
 
-        self.anim_t += dt
+        # Every anim_t frequency (0.5, 0.7, 0.8, 1, 2, 20) repeats within 20*pi, so wrapping at a multiple of it is seamless
+        self.anim_t = (self.anim_t + dt) % (2000 * math.pi)
         
         hp_rage = (1.0 - (self.hp / self.max_hp)) * 1.2 # More aggressive rage
         self.rage = max(0.0, min(1.0, hp_rage + self.rage_boost))
@@ -41,78 +138,79 @@ class Boss:
             self.rage_boost -= 0.03 * dt
         
         # Floating movement
-        target_pos = Vec2(640 + math.sin(self.anim_t * 0.5) * 400, 200 + math.cos(self.anim_t * 0.8) * 100)
-        to_target = target_pos - self.body.position
-        self.body.apply_force(to_target * 5.0)
+        bp = self.body.position
+        tx, ty = 640 + math.sin(self.anim_t * 0.5) * 400, 200 + math.cos(self.anim_t * 0.8) * 100
+        self.body.apply_force(Vec2((tx - bp.x) * 5.0, (ty - bp.y) * 5.0))
         
         # Attack logic
         self.attack_timer -= dt * (1.0 + self.rage)
         if self.attack_timer <= 0:
             self._trigger_attack(player, audio)
             # Attacks become much more frequent at high rage
-            self.attack_timer = random.uniform(1.0, 2.5) / (1.0 + self.rage * 1.5)
+            self.attack_timer = self._rand.uniform(1.0, 2.5) / (1.0 + self.rage * 1.5)
 
-        # Update attacks (Arrows)
-        for atk in self.attacks[:]:
-            atk['pos'] += atk['vel'] * dt
+        # Update attacks (Arrows); survivors are compacted to the front in order and the tail is cut once
+        # Positions move in place and the tests below work on scalars, so no Vec2 temporaries per arrow
+        attacks, keep, exploded = self.attacks, 0, []
+        plx, ply = player.body.position.x, player.body.position.y
+        for atk in attacks:
+            pos = atk['pos'].iadd_(atk['vel'], dt)
             atk['t'] += dt
             
             # Trail logic
-            if random.random() < 0.4:
-                atk['trail'].append({
-                    'pos': atk['pos'].copy(),
-                    'char': random.choice(["0", "1", "x", "f", "a", "7", "!", "&"]),
-                    'life': 0.6
-                })
-            
-            for t in atk['trail'][:]:
-                t['life'] -= dt
-                if t['life'] <= 0:
-                    atk['trail'].remove(t)
+            i = self._trail_i
+            self._trail_i = (i + 1) & 4095
+            if not self._trail_i: self._refill_trail_ring()
+            if self._trail_roll[i] < 0.4: atk['trail'].add(pos, self._trail_pick[i])
+            atk['trail'].tick(dt)
 
             # Collision with player
-            if (atk['pos'] - player.body.position).length() < 30:
+            dx, dy = pos.x - plx, pos.y - ply
+            if dx * dx + dy * dy < 900.0:
                 self._apply_glitch(player, particles, audio)
-                self.explode_attack(atk, particles, audio)
+                exploded.append(pos)
                 continue
             # Remove off-screen
-            if atk['pos'].x < -100 or atk['pos'].x > 1380 or atk['pos'].y < -100 or atk['pos'].y > 820:
-                self.attacks.remove(atk)
+            if pos.x < -100 or pos.x > 1380 or pos.y < -100 or pos.y > 820:
                 continue
+            attacks[keep] = atk; keep += 1
+        del attacks[keep:]
+        if exploded: self._explode_fx(exploded, particles, audio)
 
         # Update Noise Rays
-        for ray in self.noise_rays[:]:
-            ray['timer'] -= dt
-            # Check collision with player
-            if ray['timer'] > 0:
-                # Simple line-segment vs circle collision or distance check
-                dist = self._dist_point_to_segment(player.body.position, ray['start'], ray['end'])
-                if dist < player.cfg.r + 15: # Wider collision
-                    # Apply noise to screen (handled in game.py by checking boss state)
-                    player.memory -= 8.0 * dt # More damage
-            else:
-                self.noise_rays.remove(ray)
+        self.noise_rays.tick(dt)
+        # Segment vs circle distance check against every live ray at once (wider collision)
+        # Apply noise to screen (handled in game.py by checking boss state)
+        player.memory -= 8.0 * dt * self.noise_rays.hits(player.body.position, player.cfg.r + 15) # More damage
 
         # Dash damage from player
         hit_this_frame = 0
         if player.is_dashing:
-            if (self.body.position - player.body.position).length() < self.r + 25:
+            dx, dy = bp.x - player.body.position.x, bp.y - player.body.position.y
+            d2 = dx * dx + dy * dy
+            if d2 < (self.r + 25) ** 2:
                 self.hp -= 15 # More damage per dash but more HP
                 self.rage_boost += 0.12 # Get angrier when hit
                 hit_this_frame = 1
                 
                 particles.emit(self.body.position, 30, skia.Color(255, 0, 0), speed_range=(100, 400))
                 # Push back a bit
-                kb = (self.body.position - player.body.position).normalized() * 600
-                self.body.velocity += kb
+                if d2 > 0:
+                    inv = 600.0 / math.sqrt(d2)
+                    self.body.velocity.x += dx * inv; self.body.velocity.y += dy * inv
                 if self.hp <= 0:
                     self.is_dead = True
                     particles.emit(self.body.position, 100, skia.ColorWHITE, speed_range=(200, 600))
         
         return hit_this_frame
 
+    def _refill_trail_ring(self):
+        # Plain lists, since scalar indexing into them is cheaper than into numpy arrays
+        self._trail_roll = self._rng.random(4096).tolist()
+        self._trail_pick = self._rng.integers(0, len(self._trail_chars), 4096).tolist()
+
     def _trigger_attack(self, player, audio):
-        rnd = random.random()
+        rnd = self._rand.random()
         # Increased initial speed
         atk_speed = 600 + self.rage * 600 
         
@@ -123,19 +221,14 @@ class Boss:
                 'pos': self.body.position.copy(),
                 'vel': dir * atk_speed,
                 't': 0.0,
-                'trail': [],
+                'trail': Trail(),
                 'penetrated': False # Can pass thru 1 obstacle
             })
             audio.play("hitWall", volume=0.5)
         elif rnd < 0.8:
             # Noise Ray
-            end_pos = player.body.position + Vec2(random.uniform(-150, 150), random.uniform(-150, 150))
-            self.noise_rays.append({
-                'start': self.body.position.copy(),
-                'end': end_pos,
-                'timer': 0.8 + self.rage,
-                'max_t': 0.8 + self.rage
-            })
+            end_pos = player.body.position + Vec2(self._rand.uniform(-150, 150), self._rand.uniform(-150, 150))
+            self.noise_rays.add(self.body.position, end_pos, 0.8 + self.rage)
             audio.play("noise", volume=0.4)
         else:
             # NEW: Cluster Shot - fire 5 arrows in a fan
@@ -148,42 +241,38 @@ class Boss:
                     'pos': self.body.position.copy(),
                     'vel': vel,
                     't': 0.0,
-                    'trail': [],
+                    'trail': Trail(),
                     'penetrated': False
                 })
             audio.play("shock", volume=0.6)
 
     def _apply_glitch(self, player, particles, audio):
-        effect = random.choice(["size", "flip", "color", "teleport"])
+        effect = self._rand.choice(["size", "flip", "color", "teleport"])
         player.glitch_effect_timer = 2.5 + self.rage * 2.5
         
         if effect == "size":
-            player.glitch_size_factor = random.choice([0.4, 2.5])
+            player.glitch_size_factor = self._rand.choice([0.4, 2.5])
         elif effect == "flip":
             player.glitch_flip_y = True
         elif effect == "color":
-            player.glitch_color_override = skia.Color(random.randint(50, 255), random.randint(50, 255), random.randint(50, 255))
+            player.glitch_color_override = skia.Color(self._rand.randint(50, 255), self._rand.randint(50, 255), self._rand.randint(50, 255))
         elif effect == "teleport":
-            player.body.position += Vec2(random.uniform(-300, 300), random.uniform(-300, 300))
+            player.body.position += Vec2(self._rand.uniform(-300, 300), self._rand.uniform(-300, 300))
             particles.emit(player.body.position, 25, skia.Color(255, 0, 255))
         
         audio.play("shock", volume=0.7)
         particles.emit(player.body.position, 20, skia.Color(0, 255, 0))
 
     def explode_attack(self, atk, particles, audio):
-        # Matrix green bits and smoke
-        particles.emit(atk['pos'], 25, skia.Color(50, 255, 50), speed_range=(50, 300), life_range=(0.6, 1.2))
-        particles.emit(atk['pos'], 15, skia.Color(150, 150, 150, 120), speed_range=(20, 80), life_range=(1.0, 2.5))
-        audio.play("hitWall", volume=0.4)
+        self._explode_fx([atk['pos']], particles, audio)
         if atk in self.attacks:
             self.attacks.remove(atk)
 
-    def _dist_point_to_segment(self, p, a, b):
-        l2 = (a - b).length_squared()
-        if l2 == 0: return (p - a).length()
-        t = max(0, min(1, (p - a).dot(b - a) / l2))
-        projection = a + (b - a) * t
-        return (p - projection).length()
+    def _explode_fx(self, points, particles, audio):
+        # Matrix green bits and smoke for every exploded arrow position at once; one hit sound per batch
+        particles.emit_many(points, 25, skia.Color(50, 255, 50), speed_range=(50, 300), life_range=(0.6, 1.2))
+        particles.emit_many(points, 15, skia.Color(150, 150, 150, 120), speed_range=(20, 80), life_range=(1.0, 2.5))
+        audio.play("hitWall", volume=0.4)
 
     def freeze(self, duration: float):
         self.freeze_timer = duration
@@ -196,76 +285,80 @@ class Boss:
             
         pos = self.body.position
         # Broken cloud appearance
-        paint = skia.Paint(AntiAlias=True)
-        
         if self.freeze_timer > 0:
-            paint.setColor(skia.Color(150, 200, 255, 180))
+            color = skia.Color(150, 200, 255, 180)
         else:
             r = int(100 + self.rage * 155)
             g = int(100 - self.rage * 50)
             b = int(200 - self.rage * 100)
-            paint.setColor(skia.Color(r, g, b, 180))
+            color = skia.Color(r, g, b, 180)
 
         # Main circles - more chaotic with rage
         num_circles = 6 + int(self.rage * 4)
+        t, ox, oy, sr = self.anim_t, 30 + self.rage * 20, 20 + self.rage * 15, self.BODY_SPRITE_R
+        s1, c1, s7, c7, s2, c2 = math.sin(t), math.cos(t), math.sin(t * 0.7), math.cos(t * 0.7), math.sin(t * 2), math.cos(t * 2)
+        xforms = []
         for i in range(num_circles):
-            off = Vec2(math.sin(self.anim_t + i) * (30 + self.rage * 20), 
-                       math.cos(self.anim_t * 0.7 + i) * (20 + self.rage * 15))
-            canvas.drawCircle(pos.x + off.x, pos.y + off.y, self.r * (0.8 + math.sin(self.anim_t * 2 + i) * 0.2), paint)
+            si, ci = _SIN_I[i], _COS_I[i]
+            sc = self.r * (0.8 + (s2 * ci + c2 * si) * 0.2) / sr
+            xforms.append(skia.RSXform(sc, 0.0, pos.x + (s1 * ci + c1 * si) * ox - sc * sr, pos.y + (c7 * ci - s7 * si) * oy - sc * sr))
+        # Each circle is blended on its own, so overlaps still stack alpha like separate drawCircle calls
+        canvas.drawAtlas(self._body_sprite, xforms, [self._body_rect] * num_circles, [color] * num_circles, skia.BlendMode.kModulate, paint=self._body_paint)
             
         # Glitchy bits
         if not self.freeze_timer > 0:
-            bit_paint = skia.Paint(Color=skia.ColorWHITE)
-            for _ in range(int(8 + self.rage * 20)):
-                bx = pos.x + random.uniform(-self.r * 1.5, self.r * 1.5)
-                by = pos.y + random.uniform(-self.r * 1.5, self.r * 1.5)
-                bw = random.uniform(5, 20)
+            bit_paint = self._bit_paint
+            n = int(8 + self.rage * 20)
+            bxy = self._rng.uniform(-self.r * 1.5, self.r * 1.5, (n, 2)) + (pos.x, pos.y)
+            for (bx, by), bw in zip(bxy.tolist(), self._rng.uniform(5, 20, n).tolist()):
                 canvas.drawRect(skia.Rect.MakeXYWH(bx, by, bw, bw), bit_paint)
 
         # Render attacks (Arrows)
-        atk_paint = skia.Paint(Color=skia.Color(0, 255, 0), StrokeWidth=3, Style=skia.Paint.kStroke_Style)
-        glow_paint = skia.Paint(
-            Color=skia.Color(50, 255, 50, 150),
-            StrokeWidth=10,
-            Style=skia.Paint.kStroke_Style,
-            MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 4)
-        )
-        trail_font = skia.Font(skia.Typeface.MakeDefault(), 16)
-        trail_paint = skia.Paint(Color=skia.Color(0, 255, 0, 180), AntiAlias=True)
+        atk_paint, glow_paint, trail_font, trail_paint = self._atk_paint, self._glow_paint, self._trail_font, self._trail_paint
 
+        # Arrows go out as one line list per paint; trail chars are grouped into 8 alpha buckets, one text blob each
+        arrow_pts, trails = [], []
         for atk in self.attacks:
-            # Draw trail text
-            for t in atk['trail']:
-                trail_paint.setAlpha(int(255 * (t['life'] / 0.6)))
-                canvas.drawString(t['char'], t['pos'].x, t['pos'].y, trail_font, trail_paint)
-            
-            # Arrow with glow
-            canvas.drawLine(atk['pos'].x, atk['pos'].y, atk['pos'].x - atk['vel'].x * 0.06, atk['pos'].y - atk['vel'].y * 0.06, glow_paint)
-            canvas.drawLine(atk['pos'].x, atk['pos'].y, atk['pos'].x - atk['vel'].x * 0.06, atk['pos'].y - atk['vel'].y * 0.06, atk_paint)
+            if (tr := atk['trail']).n: trails.append(tr)
+            p, v = atk['pos'], atk['vel']
+            arrow_pts += (skia.Point(p.x, p.y), skia.Point(p.x - v.x * 0.06, p.y - v.y * 0.06))
+
+        if trails:
+            life = np.concatenate([tr.life[:tr.n] for tr in trails])
+            pos = np.concatenate([tr.pos[:tr.n] for tr in trails])
+            cidx = np.concatenate([tr.cidx[:tr.n] for tr in trails])
+            bucket = np.minimum((life * (8 / 0.6)).astype(np.int32), 7)
+            for i in np.unique(bucket).tolist():
+                m = bucket == i
+                chars = "".join([self._trail_chars[c] for c in cidx[m].tolist()])
+                trail_paint.setAlpha(int(255 * (i + 1) / 8))
+                canvas.drawTextBlob(skia.TextBlob.MakeFromPosText(chars, [skia.Point(x, y) for x, y in pos[m].tolist()], trail_font), 0, 0, trail_paint)
+        if arrow_pts:
+            # Arrow with glow; the layer only covers the arrows plus room for the stroke and blur
+            xs, ys = [p.x() for p in arrow_pts], [p.y() for p in arrow_pts]
+            canvas.saveLayer(skia.Rect.MakeLTRB(min(xs) - 20, min(ys) - 20, max(xs) + 20, max(ys) + 20), self._glow_layer_paint)
+            canvas.drawPoints(skia.Canvas.kLines_PointMode, arrow_pts, glow_paint)
+            canvas.restore()
+            canvas.drawPoints(skia.Canvas.kLines_PointMode, arrow_pts, atk_paint)
 
         # Render Noise Rays
-        for ray in self.noise_rays:
-            alpha_val = ray['timer'] / ray['max_t']
+        ray_paint, inner_ray_paint = self._ray_paint, self._inner_ray_paint
+        ray_paint.setStrokeWidth(12 + math.sin(self.anim_t * 20) * 4)
+        rays = self.noise_rays; n = rays.n
+        flicker, sparks = self._rng.random((2, n))
+        for (x0, y0, x1, y1), timer, max_t, flick in zip(rays.seg[:n].tolist(), rays.timer[:n].tolist(), rays.max_t[:n].tolist(), flicker.tolist()):
+            alpha_val = timer / max_t
             alpha = int(200 * alpha_val)
             
             # Vibrant pulse/flicker
-            ray_color = skia.Color(100, 255, 100, alpha) if random.random() > 0.2 else skia.ColorWHITE
+            ray_color = skia.Color(100, 255, 100, alpha) if flick > 0.2 else skia.ColorWHITE
             
-            ray_paint = skia.Paint(
-                Color=ray_color,
-                StrokeWidth=12 + math.sin(self.anim_t * 20) * 4,
-                MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 6)
-            )
-            canvas.drawLine(ray['start'].x, ray['start'].y, ray['end'].x, ray['end'].y, ray_paint)
+            ray_paint.setColor(ray_color)
+            canvas.drawLine(x0, y0, x1, y1, ray_paint)
             
-            # Inner ray - use a fresh paint to avoid filter carryover
-            inner_ray_paint = skia.Paint(
-                Color=skia.Color(200, 255, 200, alpha),
-                StrokeWidth=3,
-                AntiAlias=True
-            )
-            canvas.drawLine(ray['start'].x, ray['start'].y, ray['end'].x, ray['end'].y, inner_ray_paint)
-            
-            # Particle effects at ends
-            if random.random() < 0.3:
-                particles.emit(ray['end'], 1, skia.Color(100, 255, 100), speed_range=(10, 50))
\ No newline at end of file
+            # Inner ray - separate paint so the blur filter never carries over
+            inner_ray_paint.setColor(skia.Color(200, 255, 200, alpha))
+            canvas.drawLine(x0, y0, x1, y1, inner_ray_paint)
+
+        # Particle effects at ends, for every sparking ray in one emit
+        if n: particles.emit_many(rays.seg[:n, 2:][sparks < 0.3], 1, skia.Color(100, 255, 100), speed_range=(10, 50))
\ No newline at end of file
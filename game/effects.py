@@ -1,13 +1,32 @@
 import random, skia, math
+import numpy as np
 from engine.effects import PostProcessSystem
+from engine.file import resource_path
 from engine.physics import Vec2
 
+_GLITCH_CHARS = np.frombuffer(b"01X#!?@$<>[]", dtype=np.uint8)
+# Opened once per process rather than per manager or per draw
+_FONT_42 = skia.Font(skia.Typeface.MakeFromFile(resource_path("assets/font.ttf")) or skia.Typeface.MakeDefault(), 42)
+
 class CorruptionManager:
     def __init__(self, engine, post_process: PostProcessSystem):
         self.engine, self.pp = engine, post_process
         self.corruption_level, self.memory_percent = 0.0, 1.0
         self.crash_timer, self.shatter_timer, self.impact_shatter_timer = 0.0, 0.0, 0.0
         self.is_shattered, self.impact_pos, self.loss_iteration, self.boss_crack_level = False, Vec2(0, 0), 0, 0.0
+        # Per-frame noise is drawn in batches from a private generator; seeded effects build their own
+        self._rng = np.random.default_rng()
+        self._rand = random.Random() # scalar rolls, kept off the module-global random state
+        # Transparent -> opaque black radial gradient, rebuilt only on resize; paint alpha scales it per frame
+        self._vignette_paint, self._vignette_size = skia.Paint(), None
+        self._crash_paint = skia.Paint(Color=skia.ColorWHITE)
+        # Crack and shard geometry is fixed by its seed, so paths are built once and only the paint alpha changes
+        self._crack_paths, self._shard_path = {}, None
+        self._crack_paint = skia.Paint(Color=skia.ColorWHITE, Style=skia.Paint.kStroke_Style, StrokeWidth=1, AntiAlias=True)
+        self._shard_paint = skia.Paint(Color=skia.ColorWHITE, Style=skia.Paint.kStroke_Style, StrokeWidth=2, AntiAlias=True)
+        self._glitch_font = _FONT_42
+        self._glitch_paint = skia.Paint(AntiAlias=True, Color=skia.ColorWHITE)
+        self._glitch_images = {} # (text, with RGB split) -> 400x64 image of the string, baseline at y=48
         
     def update(self, dt):
         self.pp.update(dt)
@@ -15,7 +34,7 @@ class CorruptionManager:
         if self.shatter_timer > 0: self.shatter_timer -= dt
         if self.impact_shatter_timer > 0: self.impact_shatter_timer -= dt
         if self.memory_percent < 0.5 and self.shatter_timer <= 0:
-            if random.random() < (0.5 - self.memory_percent) * 6.0 * dt: self.crash_timer = 0.05
+            if self._rand.random() < (0.5 - self.memory_percent) * 6.0 * dt: self.crash_timer = 0.05
         
     def on_headbang(self): self.pp.trigger_shake(20.0); self.pp.trigger_glitch(0.8); self.crash_timer = 0.15 
     def trigger_glitch(self, intensity): self.pp.trigger_glitch(intensity)
@@ -23,67 +42,103 @@ class CorruptionManager:
     def trigger_shatter(self, iteration): self.is_shattered = True; self.shatter_timer = 3.5; self.loss_iteration = iteration; self.pp.trigger_glitch(1.0); self.pp.trigger_shake(40.0)
 
     def set_corruption(self, mem_p):
-        self.memory_percent = mem_p
-        self.corruption_level = max(0.0, min(1.0, (0.75 - mem_p) / 0.65)) if mem_p < 0.75 else 0.0
+        # The level only depends on mem_p; the glitch floor is still re-applied every frame since pp.update decays it
+        if mem_p != self.memory_percent:
+            self.memory_percent = mem_p
+            self.corruption_level = max(0.0, min(1.0, (0.75 - mem_p) / 0.65)) if mem_p < 0.75 else 0.0
         self.pp.glitch = 1.0 if mem_p < 0.1 else self.corruption_level
 
     def render_vignette(self, canvas, w, h):
-        if 0 < self.shatter_timer < 2.0: return
-        grad = skia.GradientShader.MakeRadial((w/2, h/2), w*0.9, [skia.ColorTRANSPARENT, skia.Color(0, 0, 0, int(220 * self.corruption_level))], None, skia.TileMode.kClamp)
-        canvas.drawPaint(skia.Paint(Shader=grad))
+        # Below 1% the vignette is invisible; skip the full-screen gradient pass
+        if self.corruption_level < 0.01 or 0 < self.shatter_timer < 2.0: return
+        pa = self._vignette_paint
+        if self._vignette_size != (w, h):
+            self._vignette_size = (w, h); pa.setShader(skia.GradientShader.MakeRadial((w/2, h/2), w*0.9, [skia.ColorTRANSPARENT, skia.ColorBLACK], None, skia.TileMode.kClamp))
+        pa.setAlpha(int(220 * self.corruption_level)); canvas.drawPaint(pa)
 
     def render_crash(self, canvas, w, h):
         if self.crash_timer <= 0: return
-        pa = skia.Paint(Color=skia.ColorWHITE)
-        for _ in range(3 if self.memory_percent > 0.1 else 8): canvas.drawRect(skia.Rect.MakeXYWH(0, random.uniform(0, h), w, random.uniform(2, 40)), pa)
+        # All bars go into one path: opaque white, so their union looks the same as separate rects
+        path, n = skia.Path(), 3 if self.memory_percent > 0.1 else 8
+        for y, bh in zip(self._rng.uniform(0, h, n).tolist(), self._rng.uniform(2, 40, n).tolist()): path.addRect(skia.Rect.MakeXYWH(0, y, w, bh))
+        canvas.drawPath(path, self._crash_paint)
 
     def render_shatter(self, canvas, w, h):
         if self.shatter_timer <= 0: return
         if self.shatter_timer >= 2.0:
-            canvas.drawPaint(skia.Paint(Color=skia.Color(255, 255, 255, int((3.5 - self.shatter_timer) / 1.5 * 255))))
-            pa = skia.Paint(Color=skia.ColorBLACK, StrokeWidth=2); random.seed(int(self.shatter_timer * 100))
-            for _ in range(30): canvas.drawLine(random.uniform(0, w), random.uniform(0, h), random.uniform(0, w), random.uniform(0, h), pa)
-            random.seed()
+            if (a := int((3.5 - self.shatter_timer) / 1.5 * 255)) >= 4: canvas.drawPaint(skia.Paint(Color=skia.Color(255, 255, 255, a)))
+            pa = skia.Paint(Color=skia.ColorBLACK, StrokeWidth=2)
+            for x0, y0, x1, y1 in (np.random.default_rng(int(self.shatter_timer * 100)).random((30, 4)) * (w, h, w, h)).tolist(): canvas.drawLine(x0, y0, x1, y1, pa)
         else: canvas.clear(skia.ColorBLACK); self._render_glitch_text(canvas, "deja vu", w/2, h/2, self.loss_iteration, True)
 
     def render_void_text(self, canvas, text, w, h): self._render_glitch_text(canvas, text, w/2, h/2, 0.5)
 
     def _render_glitch_text(self, canvas, text, cx, cy, intensity, is_shatter=False):
-        font = skia.Font(skia.Typeface.MakeFromFile("assets/font.ttf") or skia.Typeface.MakeDefault(), 42)
-        paint = skia.Paint(AntiAlias=True, Color=skia.ColorWHITE); chars = "01X#!?@$<>[]"
-        disp = "".join([random.choice(chars) if random.random() < (0.15 * intensity if is_shatter else 0.05) else c for c in text])
-        for i in range(3):
+        # Swapped characters are replaced as bytes under one mask, so building disp never loops in Python
+        tb = np.frombuffer(text.encode("ascii", "replace"), dtype=np.uint8).copy(); n = len(tb)
+        swap = self._rng.random(n) < (0.15 * intensity if is_shatter else 0.05)
+        tb[swap] = _GLITCH_CHARS[self._rng.integers(0, len(_GLITCH_CHARS), int(np.count_nonzero(swap)))]
+        disp = tb.tobytes().decode("ascii")
+        # Clean frames blit the cached raster; a swapped string changes almost every frame, so it is shaped once
+        # into a blob and drawn directly instead of being rasterized into a throwaway image
+        blob = None if disp == text else skia.TextBlob.MakeFromString(disp, self._glitch_font)
+        # Per band: x-jitter gate, x offset, y offset, chromatic split gate
+        for i, (gx, ux, uy, gs) in enumerate(self._rng.random((3, 4)).tolist()):
             canvas.save(); canvas.clipRect(skia.Rect.MakeXYWH(cx - 200, cy - 42 + (i * 14), 400, 14))
-            ox, oy = (random.uniform(-5, 5) * intensity if random.random() > 0.7 else 0), random.uniform(-1, 1) * intensity
-            if is_shatter and random.random() > 0.5:
-                paint.setColor(skia.ColorRED); canvas.drawString(disp, cx - 80 + ox + 2, cy + oy, font, paint)
-                paint.setColor(skia.ColorCYAN); canvas.drawString(disp, cx - 80 + ox - 2, cy + oy, font, paint); paint.setColor(skia.ColorWHITE)
-            canvas.drawString(disp, cx - 80 + ox, cy + oy, font, paint); canvas.restore()
+            ox, oy = ((ux * 10 - 5) * intensity if gx > 0.7 else 0), (uy * 2 - 1) * intensity
+            if blob is None: canvas.drawImage(self._glitch_image(text, is_shatter and gs > 0.5), cx - 200 + ox, cy - 48 + oy)
+            else: self._draw_glitch_string(canvas, blob, cx - 80 + ox, cy + oy, is_shatter and gs > 0.5)
+            canvas.restore()
+
+    def _draw_glitch_string(self, canvas, blob, x, y, split):
+        paint = self._glitch_paint
+        if split:
+            paint.setColor(skia.ColorRED); canvas.drawTextBlob(blob, x + 2, y, paint)
+            paint.setColor(skia.ColorCYAN); canvas.drawTextBlob(blob, x - 2, y, paint); paint.setColor(skia.ColorWHITE)
+        canvas.drawTextBlob(blob, x, y, paint)
+
+    def _glitch_image(self, text, split):
+        # The unswapped string is rasterized once per variant; bands then only blit and clip it
+        key = (text, split)
+        if (img := self._glitch_images.get(key)) is None:
+            if len(self._glitch_images) >= 64: self._glitch_images.clear()
+            surf = skia.Surface(400, 64)
+            self._draw_glitch_string(surf.getCanvas(), skia.TextBlob.MakeFromString(text, self._glitch_font), 120, 48, split)
+            img = self._glitch_images[key] = surf.makeImageSnapshot()
+        return img
 
     def render_impact_shatter(self, canvas):
         if self.impact_shatter_timer <= 0: return
-        pa = skia.Paint(Color=skia.Color(255, 255, 255, int(self.impact_shatter_timer / 0.3 * 200)), Style=skia.Paint.kStroke_Style, StrokeWidth=2, AntiAlias=True)
-        random.seed(42)
-        for _ in range(8):
-            path = skia.Path(); path.moveTo(self.impact_pos.x, self.impact_pos.y); curr = self.impact_pos
-            for _ in range(4): curr = curr + Vec2(random.uniform(-100, 100), random.uniform(-100, 100)); path.lineTo(curr.x, curr.y)
-            canvas.drawPath(path, pa)
-        random.seed()
+        if self._shard_path is None:
+            # 8 shards of 4 random steps each around the origin; the running sum of the steps gives every vertex at once
+            self._shard_path = path = skia.Path()
+            for shard in np.cumsum(np.random.default_rng(42).uniform(-100, 100, (8, 4, 2)), axis=1).tolist():
+                path.moveTo(0, 0)
+                for x, y in shard: path.lineTo(x, y)
+        self._shard_paint.setAlpha(int(self.impact_shatter_timer / 0.3 * 200))
+        canvas.save(); canvas.translate(self.impact_pos.x, self.impact_pos.y); canvas.drawPath(self._shard_path, self._shard_paint); canvas.restore()
 
     def render_cracks(self, canvas, w, h):
         if (self.corruption_level < 0.15 and self.boss_crack_level < 0.05) or (0 < self.shatter_timer < 2.0): return
-        val = max(self.corruption_level, self.boss_crack_level); pa = skia.Paint(Color=skia.Color(255, 255, 255, int(180 * val)), Style=skia.Paint.kStroke_Style, StrokeWidth=1, AntiAlias=True)
-        random.seed(42)
-        for _ in range(int(30 * val)):
-            side = random.randint(0, 3)
-            if side == 0: start = Vec2(random.uniform(0, w), random.uniform(0, 50))
-            elif side == 1: start = Vec2(random.uniform(0, w), random.uniform(h-50, h))
-            elif side == 2: start = Vec2(random.uniform(0, 50), random.uniform(0, h))
-            else: start = Vec2(random.uniform(w-50, w), random.uniform(0, h))
-            if random.random() > val * 1.5:
-                start = Vec2(random.uniform(0, w), random.uniform(0, h))
-                if 180 < start.x < w - 180 and 180 < start.y < h - 180: continue
-            path = skia.Path(); path.moveTo(start.x, start.y); curr, dir = start, (Vec2(w/2, h/2) - start).normalized()
-            for _ in range(8): curr = curr + dir * 30 + Vec2(random.uniform(-20, 20), random.uniform(-20, 20)); path.lineTo(curr.x, curr.y)
-            canvas.drawPath(path, pa)
-        random.seed()
+        val = max(self.corruption_level, self.boss_crack_level); self._crack_paint.setAlpha(int(180 * val))
+        # Geometry follows val in 1/32 steps so the path cache stays small
+        key = (w, h, int(val * 32))
+        if (path := self._crack_paths.get(key)) is None: path = self._crack_paths[key] = self._build_cracks(w, h, key[2] / 32)
+        canvas.drawPath(path, self._crack_paint)
+
+    def _build_cracks(self, w, h, val):
+        # All 30 candidate cracks are drawn from the fixed seed, so raising val only reveals more of the same cracks
+        rng, n = np.random.default_rng(42), int(30 * val)
+        side, u, alt, alt_xy, jit = rng.integers(0, 4, 30), rng.random((30, 2)), rng.random(30), rng.random((30, 2)) * (w, h), rng.uniform(-20, 20, (30, 8, 2))
+        sx = np.where(side < 2, u[:, 0] * w, np.where(side == 2, u[:, 0] * 50, w - 50 + u[:, 0] * 50))
+        sy = np.where(side == 0, u[:, 1] * 50, np.where(side == 1, h - 50 + u[:, 1] * 50, u[:, 1] * h))
+        start = np.where((alt > val * 1.5)[:, None], alt_xy, np.stack((sx, sy), axis=1))[:n]
+        # Cracks re-rolled into the screen interior are dropped
+        keep = (alt[:n] <= val * 1.5) | ~((180 < start[:, 0]) & (start[:, 0] < w - 180) & (180 < start[:, 1]) & (start[:, 1] < h - 180))
+        d = (w / 2, h / 2) - start; d /= np.maximum(np.hypot(d[:, 0], d[:, 1]), 1e-9)[:, None]
+        pts = start[:, None, :] + np.cumsum(d[:, None, :] * 30 + jit[:n], axis=1)
+        path = skia.Path()
+        for (x0, y0), crack in zip(start[keep].tolist(), pts[keep].tolist()):
+            path.moveTo(x0, y0)
+            for x, y in crack: path.lineTo(x, y)
+        return path
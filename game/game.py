@@ -2,7 +2,7 @@ import math
 import random
 import glfw
 import skia
-from engine.collision import CollisionWorld
+from engine.collision import CollisionWorld, pack_static_rects
 from engine.component import Component, EventType
 from engine.effects import PostProcessSystem
 from engine.particles import ParticleSystem
@@ -58,6 +58,7 @@ class MemoryParasiteGame(Component):
         self.target_level = ""
         self.void_door = None
         self.void_platforms = []
+        self.void_rects = pack_static_rects([])
         self.glitch_loop_handle = None
 
         self.audio.load("assets/hitHurt.wav", "hitWall")
@@ -224,13 +225,14 @@ class MemoryParasiteGame(Component):
                     self.player.body.velocity = Vec2(0, 0)
                     self.void_door = Door(self.w - 200, self.h - 150, target_level=self.target_level)
                     self.void_platforms = [Platform(0, self.h - 50, self.w, 50)]
+                    self.void_rects = pack_static_rects(self.void_platforms)
             return
 
         if self.state == GameState.VOID:
             self.player.handle_input(self.keys)
             self.player.update_velocity(dt, self.world_corruption)
             self.phys.update(dt)
-            self.player.grounded, _ = self.level.resolve_rect_vs_static(self.player.body, self.player.width, self.player.height, self.void_platforms)
+            self.player.grounded, _ = self.level.resolve_rect_vs_static(self.player.body, self.player.width, self.player.height, self.void_rects)
             self.player.update_animation(dt)
             self.void_door.glow_t += dt
             dx, dy = self.void_door.x + self.void_door.w/2, self.void_door.y + self.void_door.h/2
@@ -321,7 +323,7 @@ class MemoryParasiteGame(Component):
                 if self.enemies.boss: self.corruption.boss_crack_level = max(self.corruption.boss_crack_level, 1.0 - self.enemies.boss.hp / self.enemies.boss.max_hp)
                 else:
                     self.corruption.boss_crack_level = 1.0; self.state = GameState.BOSS_DEATH; self.boss_death_timer = 0.0; self.audio.play("boss_death_sound", volume=1.0)
-                    self.level.platforms.clear(); self.level.doors.clear(); self.level.cables.clear(); self.level.relays.clear(); self.sparks.clear(); self.enemies.enemies.clear()
+                    self.level.platforms.clear(); self.level.doors.clear(); self.level.cables.clear(); self.level.relays.clear(); self.sparks.clear(); self.enemies.reset_for_death()
                     self.player.body.position = Vec2(self.w/2, self.h-150); self.player.body.velocity = Vec2(0, 0)
                 self.corruption.boss_crack_level = min(1.0, self.corruption.boss_crack_level + 0.1)
             self.audio.play(random.choice(["glitch1", "glitch2", "glitch3"]), volume=0.8)
@@ -2,7 +2,7 @@ import math, random, glfw, skia
 from engine.assets import AssetManager
 from engine.file import FileManager, resource_path
 from engine.physics import Vec2
-from engine.sprite import Sprite
+from engine.sprite import Rect, Sprite
 
 class IntroManager:
     def __init__(self, w, h, audio):
@@ -10,7 +10,9 @@ class IntroManager:
         for s in ["type", "explode", "dialup", "step"]: self.audio.load(f"assets/{s}.wav", s)
         self.state, self.t = "WALKING_IN", 0.0
         self.guide_pos, self.guide_spritesheet = Vec2(w - 250, h - 80), AssetManager.get().load_spritesheet("assets/guide.png", 16, 16, 1, "guide")
-        self.guide_frame, self.guide_vanished = 2, False
+        self.guide_sprite = None
+        if self.guide_spritesheet: self.guide_sprite = Sprite(self.guide_spritesheet.image); self.guide_sprite.scale = Vec2(6, 6); self.guide_sprite.flip_x = True
+        self.guide_frame, self.guide_vanished, self.view = 2, False, Rect(0, 0, w, h)
         self.player_visual_pos, self.player_target_x = Vec2(-50, h - 80), 200
         self.dialog_lines, self.current_line_idx, self.current_text, self.char_timer, self.char_speed = [], 0, "", 0.0, 0.03
         self.matrix_t, self.door_glitch_t, self.boot_t = 0.0, 0.0, 0.0
@@ -21,9 +23,8 @@ class IntroManager:
         self.font, self.boot_font, self.ui_font = skia.Font(tf, 20), skia.Font(tf, 24), skia.Font(tf, 21)
 
     def load_dialog(self):
-        root = FileManager.get().load_xml("dialog_intro.xml")
-        if root is not None:
-            for line in root.findall("line"): self.dialog_lines.append(line.text)
+        lines = []
+        if FileManager.get().load_xml("dialog_intro.xml", lambda el: lines.append(el.text) if el.tag == "line" else None) is not None: self.dialog_lines.extend(lines)
         else: self.dialog_lines = ["Hello...", "Initialization complete."]
 
     def update(self, dt, keys, particles):
@@ -67,7 +68,7 @@ class IntroManager:
             canvas.drawString(self.boot_text, 100, 200 + self.current_boot_line * 40, self.boot_font, pa); return
         canvas.drawRect(skia.Rect.MakeXYWH(0, self.h - 50, self.w, 50), skia.Paint(Color=skia.Color(30, 30, 30)))
         if not self.guide_vanished and self.guide_spritesheet:
-            sprite = Sprite(self.guide_spritesheet.get_frame(self.guide_frame)); sprite.scale = Vec2(6, 6); sprite.flip_x = True; sprite.render(canvas, self.guide_pos)
+            self.guide_sprite.src_rect = self.guide_spritesheet.get_src_rect(self.guide_frame); self.guide_sprite.render(canvas, self.guide_pos, self.view)
         player_sprite.animation_frame = (1 if (int(self.t * 10) % 2 == 0) else 0) if self.state == "WALKING_IN" or (self.state == "DOOR_WAIT" and self.player_visual_pos.x > 200) else 2
         player_sprite.render_at(canvas, self.player_visual_pos, flip=False)
         if self.state == "TALKING" and self.current_text: self.render_dialog(canvas)
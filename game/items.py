@@ -3,6 +3,10 @@ from engine.file import resource_path
 from engine.physics import Vec2
 
 class Fruit:
+    # Shared, immutable paints; the blur mask filter is the expensive part to rebuild per draw
+    GLOW_PAINT = skia.Paint(Color=skia.Color(200, 200, 255, 120), MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 8))
+    DOT_PAINT = skia.Paint(Color=skia.Color(100, 150, 255))
+
     def __init__(self, pos, idx=0):
         self.pos, self.start_y, self.idx, self.t = pos, pos.y, idx, random.uniform(0, math.pi * 2)
         self.radius, self.collected, self.type = 20.0, False, "fruit"
@@ -18,8 +22,8 @@ class Fruit:
 
     def render(self, canvas):
         if self.collected: return
-        if not self.image: canvas.drawCircle(self.pos.x + 8, self.pos.y + 8, 8, skia.Paint(Color=skia.Color(100, 150, 255))); return
-        canvas.save(); canvas.drawCircle(self.pos.x + 16, self.pos.y + 16, 12, skia.Paint(Color=skia.Color(200, 200, 255, 120), MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 8)))
+        if not self.image: canvas.drawCircle(self.pos.x + 8, self.pos.y + 8, 8, self.DOT_PAINT); return
+        canvas.save(); canvas.drawCircle(self.pos.x + 16, self.pos.y + 16, 12, self.GLOW_PAINT)
         canvas.drawImageRect(self.image, skia.Rect.MakeXYWH(self.idx * self.f_sz, 0, self.f_sz, self.f_sz), skia.Rect.MakeXYWH(self.pos.x, self.pos.y, self.f_sz * 2, self.f_sz * 2)); canvas.restore()
 
 class Fragment(Fruit):
@@ -29,7 +33,7 @@ class Fragment(Fruit):
     def render(self, canvas):
         if self.collected: return
         canvas.save(); canvas.translate(self.pos.x + 16, self.pos.y + 16); canvas.rotate(self.rot + math.sin(self.t) * 20)
-        canvas.drawCircle(0, 0, 10, skia.Paint(Color=skia.Color(200, 200, 255, 120), MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 8)))
+        canvas.drawCircle(0, 0, 10, self.GLOW_PAINT)
         canvas.drawImageRect(self.image, skia.Rect.MakeXYWH(0, 0, 16, 16), skia.Rect.MakeXYWH(-16, -16, 32, 32)); canvas.restore()
 
 class ItemManager:
@@ -2,6 +2,7 @@ import math
 import random
 from dataclasses import dataclass, field
 
+import numpy as np
 import skia
 from skia import Paint
 
@@ -83,6 +84,10 @@ class LevelManager:
         self.active_dialog = None
         self.dialog_timer = 0.0
         self.pulse_timer = 0.0
+        # (N, 4) x/y/w/h of self.platforms for the collision pass; rebuilt when the list changes,
+        # rows of moving platforms refreshed in update()
+        self._rects = None
+        self._rects_src = None
 
         # Font for tutorial text
         self.typeface = (
@@ -93,6 +98,7 @@ class LevelManager:
 
     def load_from_xml(self, level_name: str):
         self.platforms.clear()
+        self._rects = None
         self.doors.clear()
         self.cables.clear()
         self.relays.clear()
@@ -180,6 +186,7 @@ class LevelManager:
 
     def generate(self, level_idx: int = 1):
         self.platforms.clear()
+        self._rects = None
         self.doors.clear()
         self.platforms.append(Platform(0, self.h - 50, self.w, 50))
         self.doors.append(Door(self.w - 100, self.h - 140, target_level="level2"))
@@ -247,7 +254,8 @@ class LevelManager:
                 self.active_dialog = d["text"]
                 self.dialog_timer = 5.0  # Show for 5 seconds
 
-        for p in self.platforms:
+        rects = self._platform_rects()
+        for i, p in enumerate(self.platforms):
             is_visible_req = (p.memory_req is None) or (
                 player_memory_percent <= p.memory_req
             )
@@ -318,10 +326,12 @@ class LevelManager:
                         p.w = 20
                     if p.w > 500:
                         p.w = 500
+                rects[i] = (p.x, p.y, p.w, p.h)
             elif p.is_lost or p.glitch_type is not None:
                 # Reset to original position if not chaos (to be safe)
                 p.x = p.orig_x
                 p.y = p.orig_y
+                rects[i, :2] = (p.x, p.y)
 
         for d in self.doors:
             d.glow_t += dt
@@ -353,38 +363,49 @@ class LevelManager:
             if p.reveal_t > 0:
                 p.reveal_t -= dt
 
+    def _is_visible(self, p, player_memory_percent, fragments_collected, t):
+        is_visible_req = p.memory_req is None or player_memory_percent <= p.memory_req
+        is_visible_min = p.memory_min is None or player_memory_percent >= p.memory_min
+        is_visible_frag = (
+            p.fragment_req is None or fragments_collected >= p.fragment_req
+        )
+
+        is_visible_blink = True
+        if p.blink_freq is not None:
+            freq = p.blink_freq * (0.2 + player_memory_percent * 2.0)
+            is_visible_blink = math.sin(t * freq) > 0
+
+        return (
+            is_visible_req
+            and is_visible_min
+            and is_visible_frag
+            and is_visible_blink
+            and (not p.is_hidden or p.reveal_t > 0)
+        )
+
     def get_visible_platforms(
         self, player_memory_percent: float, fragments_collected: int = 0
     ):
         # We need self.glow_t_accum for synchronized blinking in collision check too
         t = getattr(self, "glow_t_accum", 0.0)
-
-        visible = []
-        for p in self.platforms:
-            is_visible_req = (
-                p.memory_req is None or player_memory_percent <= p.memory_req
-            )
-            is_visible_min = (
-                p.memory_min is None or player_memory_percent >= p.memory_min
-            )
-            is_visible_frag = (
-                p.fragment_req is None or fragments_collected >= p.fragment_req
-            )
-
-            is_visible_blink = True
-            if p.blink_freq is not None:
-                freq = p.blink_freq * (0.2 + player_memory_percent * 2.0)
-                is_visible_blink = math.sin(t * freq) > 0
-
-            if (
-                is_visible_req
-                and is_visible_min
-                and is_visible_frag
-                and is_visible_blink
-            ):
-                if not p.is_hidden or p.reveal_t > 0:
-                    visible.append(p)
-        return visible
+        return [
+            p
+            for p in self.platforms
+            if self._is_visible(p, player_memory_percent, fragments_collected, t)
+        ]
+
+    def _platform_rects(self):
+        # Rebuilt only when the platform list is replaced, cleared or grown
+        if (
+            self._rects is None
+            or self._rects_src is not self.platforms
+            or len(self._rects) != len(self.platforms)
+        ):
+            self._rects = np.array(
+                [(p.x, p.y, p.w, p.h) for p in self.platforms], dtype=np.float64
+            ).reshape(-1, 4)
+            self._rects_src = self.platforms
+        return self._rects
 
     def resolve_rect_vs_static(self, body, width, height, static_rects):
         return resolve_rect_vs_static(body, width, height, static_rects)
@@ -398,15 +419,23 @@ class LevelManager:
         world_corruption: float = 0.0,
         fragments_collected: int = 0,
     ) -> tuple:
-        visible = self.get_visible_platforms(player_memory_percent, fragments_collected)
-        collision_rects = []
-        for p in visible:
-            if p.temp_corrupt_t > 0 and not p.is_permanent:
-                continue
-            scale_w = 1.0 - (world_corruption * 0.2)
-            nw = p.w * scale_w
-            nx = p.x + (p.w - nw) / 2
-            collision_rects.append((nx, p.y, nw, p.h))
+        rects = self._platform_rects()
+        t = getattr(self, "glow_t_accum", 0.0)
+        # Temporarily corrupted platforms are walk-through unless permanent
+        solid = np.fromiter(
+            (
+                self._is_visible(p, player_memory_percent, fragments_collected, t)
+                and (p.temp_corrupt_t <= 0 or p.is_permanent)
+                for p in self.platforms
+            ),
+            dtype=np.bool_,
+            count=len(self.platforms),
+        )
+        collision_rects = rects[solid]
+        # World corruption shrinks every platform's collision width about its centre
+        scale_w = 1.0 - (world_corruption * 0.2)
+        collision_rects[:, 0] += collision_rects[:, 2] * (1.0 - scale_w) / 2
+        collision_rects[:, 2] *= scale_w
 
         return resolve_rect_vs_static(
             player_body, player_width, player_height, collision_rects
@@ -73,6 +73,8 @@ class MemoryPlayer:
             "assets/player.png", frame_w=16, frame_h=16, offset=1, key="player"
         )
         self.spritesheet = spritesheet
+        # One sprite reused every frame so its paint and color filter survive between draws
+        self.sprite = Sprite(spritesheet.image) if spritesheet is not None else None
 
         self.animation_frame = 0
         self.anim_timer = 0.0
@@ -202,22 +204,23 @@ class MemoryPlayer:
 
     def render_at(self, canvas: skia.Canvas, pos: Vec2, flip: bool = False):
         if self.spritesheet is not None:
-            frame_image = self.spritesheet.get_frame(self.animation_frame)
-            if frame_image is not None:
-                sprite = Sprite(frame_image)
-                sprite.scale = Vec2(self.scale.x * self.glitch_size_factor, self.scale.y * self.glitch_size_factor)
-                sprite.alpha = self.alpha
+            src_rect = self.spritesheet.get_src_rect(self.animation_frame)
+            if src_rect is not None:
+                sprite = self.sprite; sprite.src_rect = src_rect
+                sprite.scale.x, sprite.scale.y = self.scale.x * self.glitch_size_factor, self.scale.y * self.glitch_size_factor
+                color, alpha = skia.ColorWHITE, self.alpha
                 
                 if self.glitch_color_override:
-                    sprite.color = self.glitch_color_override
+                    color = self.glitch_color_override
                 elif self.loss_iteration > 0:
                     r = max(0, 255 - self.loss_iteration * 20)
-                    sprite.color = skia.Color(255, r, r) 
-                    sprite.alpha = min(self.alpha, max(0.4, 1.0 - self.loss_iteration * 0.05))
+                    color = skia.Color(255, r, r) 
+                    alpha = min(self.alpha, max(0.4, 1.0 - self.loss_iteration * 0.05))
                 
                 if self.is_dashing:
-                    sprite.color = skia.Color(100, 200, 255)
-                    sprite.alpha = 0.7
+                    color = skia.Color(100, 200, 255)
+                    alpha = 0.7
+                sprite.color, sprite.alpha = color, alpha
                 
                 canvas.save()
                 canvas.translate(pos.x + self.cfg.visual_offset.x, pos.y + self.cfg.visual_offset.y)
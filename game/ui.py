@@ -27,6 +27,25 @@ class UIManager:
         self.fruit_image = skia.Image.MakeFromEncoded(skia.Data.MakeFromFileName(resource_path("assets/fruit.png")))
         self.fruit_frame_size = 16
 
+        # Paints and fonts are built once; render only swaps the bar colour
+        self.paint_text = skia.Paint(AntiAlias=True, Color=self.color_text)
+        self.paint_frame = skia.Paint(Style=skia.Paint.kStroke_Style, StrokeWidth=2, Color=self.color_frame)
+        self.paint_bg = skia.Paint(Color=self.color_bg, Style=skia.Paint.kFill_Style)
+        self.paint_seg = skia.Paint(Style=skia.Paint.kFill_Style)
+        self.paint_scan = skia.Paint(Color=skia.Color(0, 0, 0, 50), Style=skia.Paint.kFill_Style)
+        self.glow_pa = skia.Paint(
+            Color=skia.Color(100, 200, 255, 60),
+            MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 10)
+        )
+        self.ghost_paints = []
+        for c in (skia.ColorRED, skia.ColorCYAN, skia.ColorWHITE):
+            p = skia.Paint(ColorFilter=skia.ColorFilters.Blend(c, skia.BlendMode.kModulate))
+            p.setAlpha(180)
+            self.ghost_paints.append(p)
+        self.half_alpha_paint = skia.Paint(Alphaf=0.5)
+        self.hint_font = skia.Font(self.typeface, 14)
+        self.hint_paint = skia.Paint(Color=skia.Color(200, 200, 200, 220), AntiAlias=True)
+
     def render(self, canvas: skia.Canvas, memory: float, max_memory: float, fruits: int = 0):
         percent = max(0.0, min(1.0, memory / max_memory))
         
@@ -37,16 +56,13 @@ class UIManager:
         y = 40
 
         # Draw Label
-        paint_text = skia.Paint(AntiAlias=True, Color=self.color_text)
-        canvas.drawString(f"MEMORY SYSTEM: {int(percent * 100)}%", x, y - 10, self.font, paint_text)
+        canvas.drawString(f"MEMORY SYSTEM: {int(percent * 100)}%", x, y - 10, self.font, self.paint_text)
 
         # Draw Outer Frame
-        paint_frame = skia.Paint(Style=skia.Paint.kStroke_Style, StrokeWidth=2, Color=self.color_frame)
-        canvas.drawRect(skia.Rect.MakeXYWH(x - 2, y - 2, bar_w + 4, bar_h + 4), paint_frame)
+        canvas.drawRect(skia.Rect.MakeXYWH(x - 2, y - 2, bar_w + 4, bar_h + 4), self.paint_frame)
 
         # Draw Background
-        paint_bg = skia.Paint(Color=self.color_bg, Style=skia.Paint.kFill_Style)
-        canvas.drawRect(skia.Rect.MakeXYWH(x, y, bar_w, bar_h), paint_bg)
+        canvas.drawRect(skia.Rect.MakeXYWH(x, y, bar_w, bar_h), self.paint_bg)
 
         # Draw Segments (Retro blocky look)
         if percent > 0:
@@ -62,7 +78,8 @@ class UIManager:
             else:
                 bar_color = self.color_bar_low
                 
-            paint_seg = skia.Paint(Color=bar_color, Style=skia.Paint.kFill_Style)
+            paint_seg = self.paint_seg
+            paint_seg.setColor(bar_color)
             
             for i in range(filled_segments):
                 # Draw individual blocks with a 1px gap
@@ -72,9 +89,8 @@ class UIManager:
                 )
 
         # Add scanline effect over the bar for extra retro feel
-        paint_scan = skia.Paint(Color=skia.Color(0, 0, 0, 50), Style=skia.Paint.kFill_Style)
         for i in range(0, bar_h, 4):
-            canvas.drawRect(skia.Rect.MakeXYWH(x, y + i, bar_w, 1), paint_scan)
+            canvas.drawRect(skia.Rect.MakeXYWH(x, y + i, bar_w, 1), self.paint_scan)
 
         if fruits > 0:
             self._render_fruit_indicator(canvas, x + bar_w + 20, y - 5, fruits, percent)
@@ -102,11 +118,7 @@ class UIManager:
         dst = dst.makeOutset(pulse, pulse)
 
         # Background glow
-        glow_pa = skia.Paint(
-            Color=skia.Color(100, 200, 255, 60),
-            MaskFilter=skia.MaskFilter.MakeBlur(skia.kNormal_BlurStyle, 10)
-        )
-        canvas.drawCircle(x + dst_size/2, y + dst_size/2, dst_size/2 + 5, glow_pa)
+        canvas.drawCircle(x + dst_size/2, y + dst_size/2, dst_size/2 + 5, self.glow_pa)
 
         # Glitch effect intensity based on memory loss
         glitch_intensity = max(0.0, 1.0 - mem_percent)
@@ -117,16 +129,11 @@ class UIManager:
                 ox = random.uniform(-6, 6) * glitch_intensity
                 oy = random.uniform(-6, 6) * glitch_intensity
                 
-                colors = [skia.ColorRED, skia.ColorCYAN, skia.ColorWHITE]
-                p = skia.Paint(ColorFilter=skia.ColorFilters.Blend(colors[i], skia.BlendMode.kModulate))
-                p.setAlpha(180)
-                
-                canvas.drawImageRect(self.fruit_image, src, dst.makeOffset(ox, oy), paint=p)
+                canvas.drawImageRect(self.fruit_image, src, dst.makeOffset(ox, oy), paint=self.ghost_paints[i])
         else:
             # Subtle double image glitch even at high memory
             if random.random() < 0.1:
-                p = skia.Paint(Alphaf=0.5)
-                canvas.drawImageRect(self.fruit_image, src, dst.makeOffset(random.uniform(-2, 2), 0), paint=p)
+                canvas.drawImageRect(self.fruit_image, src, dst.makeOffset(random.uniform(-2, 2), 0), paint=self.half_alpha_paint)
             
             canvas.drawImageRect(self.fruit_image, src, dst)
             
@@ -140,6 +147,4 @@ class UIManager:
             canvas.restore()
         
         # Draw "1" key hint
-        hint_font = skia.Font(self.typeface, 14)
-        hint_paint = skia.Paint(Color=skia.Color(200, 200, 200, 220), AntiAlias=True)
-        canvas.drawString("[1] USE", x + dst_size/2 - 25, y + dst_size + 18, hint_font, hint_paint)
+        canvas.drawString("[1] USE", x + dst_size/2 - 25, y + dst_size + 18, self.hint_font, self.hint_paint)
@@ -26,14 +26,14 @@ def main():
         post_process.update(dt)
         game.on_update(dt)
 
-        canvas = engine.surface.getCanvas()
-        canvas.clear(skia.ColorBLACK)
+        canvas = engine.begin_ui_frame()
 
         canvas.save()
         if engine.canvas_offset != (0, 0):
             canvas.translate(engine.canvas_offset[0], engine.canvas_offset[1])
         game.on_render_ui(canvas)
         canvas.restore()
+        engine.end_ui_frame(skia.ColorBLACK)
 
         engine.fps = 1.0 / dt if dt > 0 else 60
         # engine._render_fps(canvas)
@@ -44,26 +44,11 @@ def main():
         engine.ctx.enable(moderngl.BLEND)
         engine.ctx.blend_func = (moderngl.SRC_ALPHA, moderngl.ONE_MINUS_SRC_ALPHA)
 
-        # Pass 1: VHS
-        engine.fbo.use()
-        engine.ctx.clear(0, 0, 0, 0)
-        engine.ui_texture.use(0)
-        engine.blit_vaos["vhs"].render(moderngl.TRIANGLE_STRIP)
-
-        # Pass 2: Matrix
-        engine.fbo2.use()
-        engine.ctx.clear(0, 0, 0, 0)
-        engine.temp_texture.use(0)
-        engine.screen_vaos["matrix"].render(moderngl.TRIANGLE_STRIP)
-
-        # Pass 3: CRT
-        engine.ctx.screen.use()
-        engine.ctx.clear(0, 0, 0, 1)
-        engine.temp_texture2.use(0)
-        engine.screen_vaos["crt"].render(moderngl.TRIANGLE_STRIP)
+        # VHS -> Matrix -> CRT, fused into a single pass unless debug mode is on
+        engine._render_post_process()
 
         glfw.swap_buffers(engine.window)
-        glfw.poll_events()
+        engine.poll_events()
         engine.run_heartbeat()
 
     glfw.terminate()
@@ -0,0 +1,23 @@
+import unittest
+import numpy as np
+from engine import animation as anim
+
+class EaseEndpointsTest(unittest.TestCase):
+    def test_ease_out_cubic_endpoints(self):
+        self.assertEqual(anim.ease_out_cubic(0.0), 0.0)
+        self.assertEqual(anim.ease_out_cubic(1.0), 1.0)
+
+    def test_lut_curves_match_closed_form_at_endpoints(self):
+        # The tables are float32, so the endpoints are compared within float32 precision
+        for lut_curve, exact in ((anim.ease_in_out_quad, anim._ease_in_out_quad), (anim.bounce_out, anim._bounce_out)):
+            for t in (0.0, 1.0):
+                with self.subTest(curve=lut_curve.__name__, t=t):
+                    self.assertAlmostEqual(lut_curve(t), exact(t), places=6)
+
+    def test_vector_curves_match_scalar_at_endpoints(self):
+        ends = np.array([0.0, 1.0])
+        for curve, cid in anim._CURVE_IDS.items():
+            with self.subTest(curve=curve.__name__):
+                np.testing.assert_allclose(anim._CURVES_VEC[cid](ends), [curve(0.0), curve(1.0)], atol=1e-6)
+
+if __name__ == "__main__": unittest.main()